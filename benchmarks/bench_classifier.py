@@ -0,0 +1,162 @@
+#!/usr/bin/env python3
+"""
+Micro-benchmark link text classification over thousands of link texts.
+
+Compares link_classifier.classify_link with the per-link heuristic the
+scraper used before (tag list and use-case table rebuilt for every anchor,
+upper-casing per tag and a Python-level word loop). classify_link is first
+checked against CASES, and the benchmark exits non-zero if any disagree.
+"""
+
+import argparse
+import glob
+import os
+import sys
+import time
+
+from bs4 import BeautifulSoup
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from link_classifier import classify_link, use_cases_for  # noqa: E402
+from scraper_updated import TOOL_LINKS  # noqa: E402
+
+PAGES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures", "pages")
+
+# Link text and the (name, description, pricing) classify_link must give for it
+CASES = [
+    ("Colour Contrast AnalyserFree", ("Colour Contrast Analyser", "", "FREE")),
+    ("Figma Design and prototyping Free + Paid", ("Figma Design", "and prototyping", "FREE + PAID")),
+    ("Lottie Animations for apps Freemium", ("Lottie Animations", "for apps", "FREEMIUM")),
+    ("Freepik Vectors and photos With attribution", ("Freepik Vectors", "and photos", "WITH ATTRIBUTION")),
+    ("Webflow Visual web builderPaid", ("Webflow Visual", "web builder", "PAID")),
+    ("Freebies Weekly design goodies", ("Freebies Weekly", "design goodies", "FREE")),
+    # Pricing words inside other words are part of the description
+    ("Pexels Stock photos carefree", ("Pexels Stock", "photos carefree", "FREE")),
+    ("Unsplash Beautiful royalty-free", ("Unsplash Beautiful royalty-free", "", "FREE")),
+    ("Prepaid Cards for design teams", ("Prepaid Cards", "for design teams", "FREE")),
+    ("Unpaid Invoices tracker for freelancers", ("Unpaid Invoices", "tracker for freelancers", "FREE")),
+]
+
+
+def legacy_classify(link_text, category_name):
+    """The original inline heuristic, kept here as the baseline"""
+    parts = link_text.split()
+    if len(parts) < 2:
+        return None
+
+    pricing_tags = ['FREE', 'PAID', 'FREEMIUM', 'FREE + PAID', 'WITH ATTRIBUTION']
+    pricing = 'FREE'
+    for tag in pricing_tags:
+        if tag in link_text.upper():
+            pricing = tag
+            link_text = link_text.replace(tag, '').strip()
+            break
+
+    name = description = None
+    words = link_text.split()
+    if len(words) >= 2:
+        if len(words) <= 3:
+            name = link_text
+            description = ""
+        else:
+            name_words = []
+            desc_words = []
+            for i, word in enumerate(words):
+                if i < 3 and (word[0].isupper() or word in ['uicons', 'Heroicons', 'Lucide']):
+                    name_words.append(word)
+                else:
+                    desc_words.extend(words[i:])
+                    break
+            if not name_words:
+                name_words = words[:2]
+                desc_words = words[2:]
+            name = ' '.join(name_words)
+            description = ' '.join(desc_words)
+
+    category_use_cases = {
+        'icons': ['Icons', 'UI Design', 'Web Design'],
+        'illustrations': ['Illustrations', 'Graphics', 'Design'],
+        'typography': ['Fonts', 'Typography', 'Web Fonts'],
+        'color-tools': ['Color Palettes', 'Design', 'UI'],
+        'mockups': ['Mockups', 'Presentation', 'Design'],
+        'inspiration': ['Inspiration', 'Design Showcase', 'Gallery'],
+        'ai-tools': ['AI', 'Automation', 'Design'],
+        'design-tools': ['Design', 'UI/UX', 'Software'],
+        'ux-tools': ['UX', 'User Experience', 'Research'],
+        'accessibility': ['Accessibility', 'A11y', 'Inclusive Design'],
+        'learning': ['Learning', 'Education', 'Tutorial'],
+        'community': ['Community', 'Design Community', 'Networking'],
+        'blogs': ['Blog', 'Articles', 'Design Writing'],
+        'podcasts': ['Podcast', 'Audio', 'Design Discussion'],
+        'books': ['Books', 'Reading', 'Design Education'],
+        'stock-photos': ['Stock Photos', 'Photography', 'Images'],
+        'project-tools': ['Project Management', 'Collaboration', 'Workflow'],
+        'web-builder': ['Website Builder', 'No-Code', 'Web Development']
+    }
+    use_cases = category_use_cases.get(category_name.lower(), ['Design', 'Tools'])
+    return name, description, pricing, use_cases
+
+
+def current_classify(link_text, category_name):
+    """classify_link plus the shared use-case lookup"""
+    return classify_link(link_text), use_cases_for(category_name)
+
+
+def check_cases():
+    """The CASES classify_link gets wrong, as (text, expected, actual)"""
+    return [(text, expected, classify_link(text)) for text, expected in CASES
+            if classify_link(text) != expected]
+
+
+def load_link_texts():
+    """Flattened anchor texts from every fixture page, tagged with their category"""
+    samples = []
+    for path in sorted(glob.glob(os.path.join(PAGES_DIR, "*.html"))):
+        category_name = os.path.splitext(os.path.basename(path))[0]
+        with open(path, 'rb') as f:
+            soup = BeautifulSoup(f.read(), 'html.parser', parse_only=TOOL_LINKS)
+        samples.extend((link.get_text(strip=True), category_name) for link in soup.find_all('a', href=True))
+    return samples
+
+
+def best_time(func, samples, repeat):
+    """Fastest of repeat passes over all samples, in seconds"""
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for text, category_name in samples:
+            func(text, category_name)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--count", type=int, default=20000, help="Number of link texts to classify per pass")
+    parser.add_argument("--repeat", type=int, default=5, help="Passes; the fastest is reported")
+    args = parser.parse_args()
+
+    wrong = check_cases()
+    for text, expected, actual in wrong:
+        print(f"{text!r}: expected {expected}, got {actual}")
+    if wrong:
+        sys.exit(f"classify_link disagrees with {len(wrong)}/{len(CASES)} cases")
+
+    samples = load_link_texts()
+    if not samples:
+        sys.exit(f"No fixture pages in {PAGES_DIR}; run benchmarks/make_fixtures.py first")
+    samples = (samples * (args.count // len(samples) + 1))[:args.count]
+
+    legacy = best_time(legacy_classify, samples, args.repeat)
+    current = best_time(current_classify, samples, args.repeat)
+
+    print(f"{len(samples)} link texts")
+    print(f"legacy heuristic: {legacy * 1000:8.1f}ms  ({len(samples) / legacy:>10,.0f} links/s)")
+    print(f"classify_link:    {current * 1000:8.1f}ms  ({len(samples) / current:>10,.0f} links/s)")
+    print(f"speedup: {legacy / current:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+"""
+Benchmark category page parsing on the saved fixture pages.
+
+Compares the original full-document parse (html.parser, whole-page get_text,
+then find_all over every element) with the anchor-only SoupStrainer parse on
+each available backend.
+"""
+
+import argparse
+import glob
+import os
+import sys
+import time
+
+from bs4 import BeautifulSoup
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from scraper_updated import TOOL_LINKS  # noqa: E402
+
+PAGES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures", "pages")
+
+
+def full_document_parse(html):
+    """The original parse: full tree, whole-page text pass, then the anchors"""
+    soup = BeautifulSoup(html, 'html.parser')
+    soup.get_text()
+    return soup.find_all('a', href=True)
+
+
+def strained_parse(html, parser):
+    """Anchor-only parse on the given backend"""
+    soup = BeautifulSoup(html, parser, parse_only=TOOL_LINKS)
+    return soup.find_all('a', href=True)
+
+
+def available_parsers():
+    """Backends installed in this environment"""
+    parsers = ['html.parser']
+    try:
+        import lxml  # noqa: F401
+        parsers.insert(0, 'lxml')
+    except ImportError:
+        pass
+    return parsers
+
+
+def best_time(func, html, repeat):
+    """Fastest of repeat runs, in milliseconds"""
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(html)
+        best = min(best, time.perf_counter() - start)
+    return best * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=5, help="Runs per page; the fastest is reported")
+    args = parser.parse_args()
+
+    pages = sorted(glob.glob(os.path.join(PAGES_DIR, "*.html")))
+    if not pages:
+        sys.exit(f"No fixture pages in {PAGES_DIR}; run benchmarks/make_fixtures.py first")
+
+    backends = available_parsers()
+    variants = [('full html.parser', full_document_parse)]
+    variants += [(f'strained {name}', lambda html, name=name: strained_parse(html, name)) for name in backends]
+
+    header = f"{'page':<16}{'KB':>6}" + "".join(f"{label:>20}" for label, _ in variants) + f"{'speedup':>10}"
+    print(header)
+    print("-" * len(header))
+
+    totals = [0.0] * len(variants)
+    for path in pages:
+        with open(path, 'rb') as f:
+            html = f.read()
+        timings = [best_time(func, html, args.repeat) for _, func in variants]
+        totals = [total + t for total, t in zip(totals, timings)]
+        name = os.path.splitext(os.path.basename(path))[0]
+        print(f"{name:<16}{len(html) // 1024:>6}" + "".join(f"{t:>18.1f}ms" for t in timings)
+              + f"{timings[0] / min(timings[1:]):>9.1f}x")
+
+    print("-" * len(header))
+    print(f"{'total':<22}" + "".join(f"{t:>18.1f}ms" for t in totals) + f"{totals[0] / min(totals[1:]):>9.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+"""
+Benchmark parse throughput of ParsePool with 1..N worker processes.
+
+The saved fixture pages are submitted --rounds times to a pool of each size
+and the wall time until every page is parsed is measured. Speedup is
+relative to one worker and efficiency is speedup per worker, so near-linear
+scaling shows up as efficiency close to 100%. Also reports how much smaller
+the compact rows workers send back are than the tool dicts when pickled.
+"""
+
+import argparse
+import glob
+import os
+import pickle
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from parse_pool import ParsePool, default_workers, parse_rows, rows_to_tools  # noqa: E402
+from scraper_updated import DEFAULT_PARSER  # noqa: E402
+
+PAGES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures", "pages")
+
+
+def worker_counts(maximum):
+    """1, 2, 4, ... up to and including maximum"""
+    counts = []
+    n = 1
+    while n < maximum:
+        counts.append(n)
+        n *= 2
+    counts.append(maximum)
+    return counts
+
+
+def run_pool(pages, workers, rounds):
+    """Seconds to parse every page rounds times with workers processes"""
+    with ParsePool(DEFAULT_PARSER, workers) as pool:
+        # Start the processes and import the parser outside the timed region
+        pool.result(pool.submit(pages[0][1], pages[0][0], None), pages[0][0])
+        start = time.perf_counter()
+        futures = [(key, pool.submit(html, key, None)) for _ in range(rounds) for key, html in pages]
+        tools = sum(len(pool.result(future, key)) for key, future in futures)
+        return time.perf_counter() - start, tools
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--rounds", type=int, default=5, help="Times every page is submitted per pool size")
+    parser.add_argument("--max-workers", type=int, default=default_workers(),
+                        help="Largest pool to try (default: available cores)")
+    args = parser.parse_args()
+
+    pages = []
+    for path in sorted(glob.glob(os.path.join(PAGES_DIR, "*.html"))):
+        with open(path, 'r', encoding='utf-8') as f:
+            pages.append((os.path.splitext(os.path.basename(path))[0], f.read()))
+    if not pages:
+        sys.exit(f"No fixture pages in {PAGES_DIR}; run benchmarks/make_fixtures.py first")
+
+    print(f"{len(pages)} pages x {args.rounds} rounds, {default_workers()} cores available")
+    print(f"{'workers':>8}{'seconds':>10}{'pages/s':>10}{'speedup':>10}{'efficiency':>12}")
+    base = None
+    for workers in worker_counts(args.max_workers):
+        seconds, _ = run_pool(pages, workers, args.rounds)
+        base = base or seconds
+        speedup = base / seconds
+        print(f"{workers:>8}{seconds:>10.2f}{len(pages) * args.rounds / seconds:>10.1f}"
+              f"{speedup:>9.2f}x{speedup / workers:>12.0%}")
+
+    row_bytes = dict_bytes = 0
+    for key, html in pages:
+        rows, _ = parse_rows(html, key, DEFAULT_PARSER, None)
+        row_bytes += len(pickle.dumps(rows, pickle.HIGHEST_PROTOCOL))
+        dict_bytes += len(pickle.dumps(rows_to_tools(rows, key), pickle.HIGHEST_PROTOCOL))
+    print(f"\nPickled results: {row_bytes:,} bytes as rows vs {dict_bytes:,} bytes as dicts "
+          f"({1 - row_bytes / dict_bytes:.0%} smaller)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""
+Compare the memory of the database as plain dicts with records.py records.
+
+Runs on the synthetic fixture databases (100k tools by default). For each
+size it reports the memory retained by the loaded database and the peak
+while loading, for json.load dicts and for load_records(), the time of a
+simple pass over every tool in each form, and checks that converting the
+records back gives byte-identical JSON.
+"""
+
+import argparse
+import gc
+import json
+import os
+import sys
+import time
+import tracemalloc
+from collections import Counter
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, BENCH_DIR)
+
+from db_writer import serialize  # noqa: E402
+from make_fixtures import DATABASE_SIZES, database_path, load_database  # noqa: E402
+from records import load_records, records_to_database  # noqa: E402
+
+
+def traced(func):
+    """(result, retained bytes, peak bytes) of func()"""
+    gc.collect()
+    tracemalloc.start()
+    result = func()
+    gc.collect()
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, current, peak
+
+
+def load_dicts(path):
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def pricing_pass(tools):
+    """Tools per (pricing, first use case), the kind of scan the fix and index passes do"""
+    return Counter((tool['pricing'], tool['use_cases'][0]) for tool in tools)
+
+
+def pricing_pass_records(tools):
+    return Counter((tool.pricing, tool.use_cases[0]) for tool in tools)
+
+
+def best_time(func, repeat=3):
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs='+', default=[DATABASE_SIZES[-1]],
+                        choices=DATABASE_SIZES, help="Fixture databases to run on")
+    args = parser.parse_args()
+
+    print(f"{'tools':>8}{'form':>9}{'retained':>11}{'load peak':>12}{'per tool':>10}{'pass':>10}")
+    for size in args.sizes:
+        load_database(size)
+        path = database_path(size)
+
+        dicts, dict_bytes, dict_peak = traced(lambda: load_dicts(path))
+        records, record_bytes, record_peak = traced(lambda: load_records(path))
+
+        dict_tools = [tool for category in dicts['categories'].values() for tool in category['tools']]
+        record_tools = [tool for category in records['categories'].values() for tool in category.tools]
+        dict_pass = best_time(lambda: pricing_pass(dict_tools))
+        record_pass = best_time(lambda: pricing_pass_records(record_tools))
+        if pricing_pass(dict_tools) != pricing_pass_records(record_tools):
+            sys.exit("records pass disagrees with the dict pass")
+
+        for form, retained, peak, seconds in (('dicts', dict_bytes, dict_peak, dict_pass),
+                                              ('records', record_bytes, record_peak, record_pass)):
+            print(f"{size:>8,}{form:>9}{retained / 1e6:>8.1f} MB{peak / 1e6:>9.1f} MB"
+                  f"{retained / size:>8.0f} B{seconds * 1000:>8.1f}ms")
+        print(f"{'':>8}{'saved':>9}{1 - record_bytes / dict_bytes:>11.0%}{1 - record_peak / dict_peak:>12.0%}"
+              f"{'':>10}{dict_pass / record_pass:>9.2f}x")
+
+        lossless = serialize(records_to_database(records)) == serialize(dicts)
+        print(f"{'':>8}round trip {'byte-identical' if lossless else 'DIFFERS'}")
+        if not lossless:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+"""
+Compare query latency of the inverted search index with a linear scan.
+
+The linear scan mirrors the site's search: a case-insensitive substring test
+against every tool's name, description and use cases. The index answers
+token-prefix queries from sorted terms and posting lists.
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from search_index import SearchIndex, build_index  # noqa: E402
+
+DATABASE_FILE = os.path.join(ROOT, "data", "design_tools_database.json")
+
+QUERIES = ['icon', 'figma', 'free fonts', 'color palette', 'ai', 'mockup', 'ux research',
+           'illustrations', 'stock photo', 'accessibility', 'podcast', 'no-code', 'svg', 'gradient']
+
+
+def linear_scan(tools, query):
+    """Substring match over all tools, as SearchComponent does"""
+    query = query.lower()
+    return [tool for tool in tools
+            if query in tool['name'].lower()
+            or query in tool['description'].lower()
+            or any(query in use_case.lower() for use_case in tool.get('use_cases') or [])]
+
+
+def scale_database(database, factor):
+    """Repeat every category's tools factor times to simulate a bigger catalog"""
+    return {
+        'meta': database['meta'],
+        'categories': {key: {**category, 'tools': category['tools'] * factor}
+                       for key, category in database['categories'].items()},
+    }
+
+
+def per_query_us(func, queries, repeat):
+    """Best average latency per query in microseconds"""
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for query in queries:
+            func(query)
+        best = min(best, time.perf_counter() - start)
+    return best / len(queries) * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--scale", type=int, nargs='+', default=[1, 10], help="Catalog multipliers to test")
+    parser.add_argument("--repeat", type=int, default=5, help="Passes; the fastest is reported")
+    args = parser.parse_args()
+
+    with open(DATABASE_FILE, 'r', encoding='utf-8') as f:
+        database = json.load(f)
+
+    print(f"{'tools':>8}{'build':>10}{'scan/query':>14}{'index/query':>14}{'speedup':>10}")
+    for factor in args.scale:
+        scaled = scale_database(database, factor)
+        tools = [tool for category in scaled['categories'].values() for tool in category['tools']]
+
+        start = time.perf_counter()
+        index = SearchIndex(build_index(scaled))
+        build_ms = (time.perf_counter() - start) * 1000
+
+        scan = per_query_us(lambda q: linear_scan(tools, q), QUERIES, args.repeat)
+        indexed = per_query_us(index.search, QUERIES, args.repeat)
+        print(f"{len(tools):>8}{build_ms:>8.0f}ms{scan:>12.0f}us{indexed:>12.0f}us{scan / indexed:>9.1f}x")
+
+
+if __name__ == "__main__":
+    main()
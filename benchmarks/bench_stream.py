@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+"""
+Compare peak memory of fix_images.py with fix_images.py --stream.
+
+A synthetic database is generated by repeating the real tools across many
+categories. Each mode runs the real entry point in its own process and its
+own scratch working directory, so peak RSS is not inherited from the parent
+and every output is written: 'load' is fix_images.fix_images() and 'stream'
+is fix_images.fix_images_stream(), each writing the database copies, the
+minified and normalized variants, the category shards, the search index and
+the derived views. Wall time and peak RSS of each process are reported, and
+the two output trees are compared file by file.
+"""
+
+import argparse
+import json
+import os
+import resource
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import fix_images  # noqa: E402
+from db_writer import serialize  # noqa: E402
+
+DATABASE_FILE = os.path.join(ROOT, "data", "design_tools_database.json")
+
+
+def make_database(path, total_tools, per_category):
+    """Write a synthetic database of total_tools tools, per_category per category"""
+    with open(DATABASE_FILE, 'r', encoding='utf-8') as f:
+        source = json.load(f)
+    tools = [tool for category in source['categories'].values() for tool in category['tools']]
+
+    categories = {}
+    for start in range(0, total_tools, per_category):
+        key = f"category-{start // per_category:04d}"
+        categories[key] = {
+            'name': key.replace('-', ' ').title(),
+            'description': f"Synthetic category {key}",
+            'tools': [dict(tools[i % len(tools)], name=f"{tools[i % len(tools)]['name']} {i}")
+                      for i in range(start, min(start + per_category, total_tools))],
+        }
+    database = {'meta': {**source['meta'], 'total_tools': total_tools}, 'categories': categories}
+    with open(path, 'wb') as f:
+        f.write(serialize(database))
+
+
+MODES = {
+    'load': fix_images.fix_images,
+    'stream': fix_images.fix_images_stream,
+}
+
+
+def measure(mode, workdir):
+    """Run one mode in workdir from this process and print its measurements as JSON"""
+    os.chdir(workdir)
+    start = time.perf_counter()
+    MODES[mode]()
+    elapsed = time.perf_counter() - start
+    # ru_maxrss is in kilobytes on Linux
+    rss_kb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    print(json.dumps({'seconds': elapsed, 'rss': rss_kb * 1024}))
+
+
+def prepare(workdir, source):
+    """A scratch working directory whose database file is a copy of source"""
+    path = os.path.join(workdir, fix_images.DATABASE_FILE)
+    os.makedirs(os.path.dirname(path))
+    shutil.copyfile(source, path)
+
+
+def output_files(workdir):
+    """{relative path: bytes} of every file under workdir"""
+    files = {}
+    for directory, _, names in os.walk(workdir):
+        for name in names:
+            path = os.path.join(directory, name)
+            with open(path, 'rb') as f:
+                files[os.path.relpath(path, workdir)] = f.read()
+    return files
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--tools", type=int, default=100_000, help="Tools in the synthetic database")
+    parser.add_argument("--per-category", type=int, default=1_000, help="Tools per synthetic category")
+    parser.add_argument("--generate", action="store_true", help=argparse.SUPPRESS)
+    parser.add_argument("--measure", choices=MODES, help=argparse.SUPPRESS)
+    parser.add_argument("--workdir", help=argparse.SUPPRESS)
+    parser.add_argument("--output", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.generate:
+        make_database(args.output, args.tools, args.per_category)
+        return
+    if args.measure:
+        measure(args.measure, args.workdir)
+        return
+
+    with tempfile.TemporaryDirectory() as tmp:
+        source = os.path.join(tmp, "database.json")
+        subprocess.run([sys.executable, __file__, '--generate', '--output', source,
+                        '--tools', str(args.tools), '--per-category', str(args.per_category)], check=True)
+        print(f"{args.tools:,} tools in {-(-args.tools // args.per_category)} categories, "
+              f"{os.path.getsize(source) / 1e6:.1f} MB")
+
+        print(f"{'mode':<8}{'time':>10}{'peak rss':>12}")
+        results = {}
+        for mode in MODES:
+            workdir = os.path.join(tmp, mode)
+            prepare(workdir, source)
+            completed = subprocess.run(
+                [sys.executable, os.path.abspath(__file__), '--measure', mode, '--workdir', workdir],
+                check=True, capture_output=True, text=True)
+            results[mode] = json.loads(completed.stdout.strip().splitlines()[-1])
+            result = results[mode]
+            print(f"{mode:<8}{result['seconds']:>9.2f}s{result['rss'] / 1e6:>10.1f}MB")
+
+        loaded, streamed = (output_files(os.path.join(tmp, mode)) for mode in MODES)
+        differ = sorted(path for path in loaded.keys() | streamed.keys() if loaded.get(path) != streamed.get(path))
+        print(f"peak RSS reduced {results['load']['rss'] / results['stream']['rss']:.1f}x; "
+              f"{len(loaded)} output files {'DIFFER: ' + ', '.join(differ) if differ else 'identical'}")
+
+
+if __name__ == "__main__":
+    main()
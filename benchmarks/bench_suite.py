@@ -0,0 +1,274 @@
+#!/usr/bin/env python3
+"""
+Offline benchmark suite for the parse, transform and serialize stages.
+
+Parsing runs on the saved category pages; every other stage runs on the
+1k/10k/100k-tool fixture databases. Each stage reports throughput (pages/s
+or tools/s), peak traced memory and, for the serializers, the output size. Results
+are compared with benchmarks/baseline.json: a stage whose throughput drops,
+or whose memory or output size grows, by more than the tolerance is reported
+as a regression and the suite exits non-zero.
+
+Throughput depends on the machine, so a fixed calibration loop is timed in
+the same process, alternating with the runs of a stage, and the stage is
+compared relative to it: a machine half as fast, or a busy moment on a
+shared one, slows the loop down as much as the stage, and a baseline
+recorded elsewhere still applies. Each sample runs the stage and the loop
+for at least --min-time seconds, so millisecond stages are not timed off a
+single run, and the median of --repeat samples counts.
+"""
+
+import argparse
+import contextlib
+import copy
+import gc
+import glob
+import io
+import json
+import os
+import platform
+import sys
+import time
+import tracemalloc
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, BENCH_DIR)
+
+from canonical import dedupe_tools  # noqa: E402
+from db_writer import normalize, serialize, serialize_minified  # noqa: E402
+from derived_views import build_views  # noqa: E402
+from fix_data import OVERRIDES_FILE, apply_overrides, load_overrides  # noqa: E402
+from fix_images import fix_database_images  # noqa: E402
+from instrumentation import QUIET, set_verbosity  # noqa: E402
+from make_fixtures import DATABASE_SIZES, PAGES_DIR, load_database  # noqa: E402
+from scraper_updated import parse_category_page  # noqa: E402
+from search_index import build_index  # noqa: E402
+
+BASELINE_FILE = os.path.join(BENCH_DIR, "baseline.json")
+DEFAULT_TOLERANCE = 0.3
+
+# Iterations of the calibration loop; a few hundredths of a second
+CALIBRATION_ROUNDS = 2000
+
+# Seconds each sample runs a stage, and the calibration loop, for at least
+DEFAULT_MIN_TIME = 0.2
+DEFAULT_REPEAT = 5
+
+# Peak memory growth below this many bytes is noise (a stray allocation on a
+# stage that peaks at a few hundred bytes), whatever the tolerance says
+MEMORY_SLACK = 64 * 1024
+
+
+def load_pages():
+    """(category_key, html) for every saved page"""
+    pages = []
+    for path in sorted(glob.glob(os.path.join(PAGES_DIR, "*.html"))):
+        with open(path, 'r', encoding='utf-8') as f:
+            pages.append((os.path.splitext(os.path.basename(path))[0], f.read()))
+    return pages
+
+
+def parse_pages(pages):
+    tools = 0
+    for category_key, html in pages:
+        tools += len(parse_category_page(html, category_key))
+    return tools
+
+
+def calibration_loop():
+    """Fixed pure-Python work of the kinds the stages do: JSON, dicts and strings"""
+    tool = {'name': 'Calibration Tool', 'description': 'A fixed record timed to scale the results',
+            'url': 'https://example.com/tool', 'pricing': 'FREE', 'use_cases': ['design', 'prototyping']}
+    terms = {}
+    for n in range(CALIBRATION_ROUNDS):
+        record = json.loads(json.dumps({**tool, 'id': n}))
+        for word in record['description'].lower().split():
+            terms.setdefault(word, []).append(n)
+    return len(terms)
+
+
+def database_stages(overrides):
+    """Stage name -> function of a fresh database copy"""
+    return {
+        'load': lambda payload: json.loads(payload),
+        'curate': lambda database: apply_overrides(database, overrides),
+        'image-fix': lambda database: fix_database_images(database),
+        'dedupe': lambda database: dedupe_tools(database),
+        'index': lambda database: build_index(database),
+        'views': lambda database: build_views(database),
+        'serialize': lambda database: serialize(database),
+        'minify': lambda database: serialize_minified(database),
+        'normalize': lambda database: serialize_minified(normalize(database)),
+    }
+
+
+def measure(func, make_input, repeat, min_time):
+    """Time per run of the median of repeat samples, then peak traced memory of one more run.
+
+    Returns (seconds, calibration loops/s, peak bytes, result). In each
+    sample the calibration loop and the stage take turns, one run at a
+    time, until both have run for at least min_time, so the two see the
+    same machine; the sample whose stage speed relative to its calibration
+    is the median counts. Inputs are prepared outside the timed region so mutating
+    stages always start from the same database. Like timeit, the collector
+    is off while a sample runs, so collections triggered by the input
+    copies are not charged to the stage.
+    """
+    samples = []
+    result = None
+    for _ in range(repeat):
+        stage_time = calibration_time = 0.0
+        runs = loops = 0
+        gc.collect()
+        gc.disable()
+        try:
+            while stage_time < min_time or calibration_time < min_time:
+                if calibration_time < min_time:
+                    start = time.perf_counter()
+                    calibration_loop()
+                    calibration_time += time.perf_counter() - start
+                    loops += 1
+                if stage_time < min_time:
+                    value = make_input()
+                    start = time.perf_counter()
+                    result = func(value)
+                    stage_time += time.perf_counter() - start
+                    runs += 1
+                    del value
+        finally:
+            gc.enable()
+        samples.append((stage_time / runs, loops / calibration_time))
+
+    value = make_input()
+    tracemalloc.start()
+    func(value)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    samples.sort(key=lambda sample: sample[0] * sample[1])
+    seconds, calibration = samples[len(samples) // 2]
+    return seconds, calibration, peak, result
+
+
+def run_suite(sizes, repeat, min_time):
+    """Run every stage and return {stage key: metrics}"""
+    results = {}
+    overrides = load_overrides(OVERRIDES_FILE)
+
+    pages = load_pages()
+    seconds, calibration, peak, tools = measure(parse_pages, lambda: pages, repeat, min_time)
+    results['parse/pages'] = {
+        'unit': 'pages/s',
+        'throughput': len(pages) / seconds,
+        'tools_per_second': tools / seconds,
+        'peak_bytes': peak,
+        'calibration': calibration,
+    }
+
+    for size in sizes:
+        database = load_database(size)
+        payload = serialize(database)
+        for name, func in database_stages(overrides).items():
+            if name == 'load':
+                make_input = lambda: payload  # noqa: E731
+            else:
+                make_input = lambda: copy.deepcopy(database)  # noqa: E731
+            seconds, calibration, peak, output = measure(func, make_input, repeat, min_time)
+            metrics = {'unit': 'tools/s', 'throughput': size / seconds, 'peak_bytes': peak,
+                       'calibration': calibration}
+            if isinstance(output, bytes):
+                metrics['size_bytes'] = len(output)
+            results[f"{name}/{size // 1000}k"] = metrics
+    return results
+
+
+def relative(results, baseline):
+    """{stage key: throughput / baseline throughput}, each scaled by the calibration before it.
+
+    Baseline stages without a calibration (recorded before it existed) are
+    left out rather than compared as absolute numbers.
+    """
+    return {key: (metrics['throughput'] / metrics['calibration'])
+            / (baseline[key]['throughput'] / baseline[key]['calibration'])
+            for key, metrics in results.items() if baseline.get(key, {}).get('calibration')}
+
+
+def compare(results, baseline, ratios, tolerance):
+    """Regression messages for results that are worse than baseline by more than tolerance"""
+    regressions = []
+    for key, metrics in results.items():
+        base = baseline.get(key)
+        if not base:
+            continue
+        if key in ratios and ratios[key] < 1 - tolerance:
+            regressions.append(f"{key}: throughput {ratios[key]:.2f}x the baseline after calibration "
+                               f"({metrics['throughput']:,.0f} vs {base['throughput']:,.0f} {metrics['unit']})")
+        if metrics['peak_bytes'] > base['peak_bytes'] * (1 + tolerance) + MEMORY_SLACK:
+            regressions.append(f"{key}: peak memory {metrics['peak_bytes'] / 1e6:.1f} MB "
+                               f"vs baseline {base['peak_bytes'] / 1e6:.1f} MB")
+        if 'size_bytes' in base and metrics.get('size_bytes', 0) > base['size_bytes'] * (1 + tolerance):
+            regressions.append(f"{key}: output {metrics['size_bytes']:,} bytes vs baseline {base['size_bytes']:,}")
+    return regressions
+
+
+def print_results(results, ratios):
+    print(f"{'stage':<18}{'throughput':>20}{'peak mem':>11}{'size':>13}{'vs baseline':>13}")
+    for key, metrics in results.items():
+        ratio = f"{ratios[key]:.2f}x" if key in ratios else '-'
+        size = f"{metrics['size_bytes']:,}" if 'size_bytes' in metrics else ''
+        print(f"{key:<18}{metrics['throughput']:>12,.0f} {metrics['unit']:<7}"
+              f"{metrics['peak_bytes'] / 1e6:>8.1f} MB{size:>13}{ratio:>13}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs='+', default=DATABASE_SIZES,
+                        choices=DATABASE_SIZES, help="Fixture databases to run on")
+    parser.add_argument("--repeat", type=int, default=DEFAULT_REPEAT, help="Samples per stage; the median counts")
+    parser.add_argument("--min-time", type=float, default=DEFAULT_MIN_TIME,
+                        help="Seconds each sample runs a stage and the calibration loop for at least")
+    parser.add_argument("--baseline", default=BASELINE_FILE, help="Stored results to compare against")
+    parser.add_argument("--tolerance", type=float, default=DEFAULT_TOLERANCE,
+                        help="Allowed relative slowdown or growth before a stage counts as a regression")
+    parser.add_argument("--save-baseline", action="store_true", help="Store these results as the new baseline")
+    args = parser.parse_args()
+
+    try:
+        with open(args.baseline, 'r', encoding='utf-8') as f:
+            baseline = json.load(f)['results']
+    except (OSError, ValueError, KeyError):
+        baseline = {}
+
+    # The stages print progress; keep the report readable
+    set_verbosity(QUIET)
+    with contextlib.redirect_stdout(io.StringIO()):
+        results = run_suite(args.sizes, args.repeat, args.min_time)
+
+    ratios = relative(results, baseline)
+    print_results(results, ratios)
+
+    if args.save_baseline:
+        with open(args.baseline, 'w', encoding='utf-8') as f:
+            json.dump({
+                'python': platform.python_version(),
+                'machine': platform.machine(),
+                'results': results,
+            }, f, indent=2)
+        print(f"\nBaseline saved to {os.path.relpath(args.baseline, ROOT)}")
+        return
+
+    regressions = compare(results, baseline, ratios, args.tolerance)
+    if regressions:
+        print(f"\nREGRESSIONS (tolerance {args.tolerance:.0%}):")
+        for message in regressions:
+            print(f"  {message}")
+        sys.exit(1)
+    if ratios:
+        print(f"\nNo regressions against {os.path.relpath(args.baseline, ROOT)} (tolerance {args.tolerance:.0%})")
+    else:
+        print("\nNo calibrated baseline yet; run with --save-baseline to store one")
+
+
+if __name__ == "__main__":
+    main()
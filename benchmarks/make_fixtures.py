@@ -0,0 +1,178 @@
+#!/usr/bin/env python3
+"""
+Render saved-page fixtures shaped like toools.design category pages, and
+the synthetic databases the benchmark suite runs on.
+
+Each page is rebuilt from the current database using the site's card markup
+(link > logo, heading, paragraph, pricing badge) plus the navigation, styles
+and scripts that surround it, so parsing benchmarks see realistic documents
+without touching the network.
+
+The 1k-tool database is checked in as the seed; bigger ones are grown from it
+deterministically and cached next to it (they are not committed).
+"""
+
+import argparse
+import html
+import json
+import os
+import re
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from scraper_updated import BASE_URL, get_categories  # noqa: E402
+
+DATABASE_FILE = os.path.join(ROOT, "data", "design_tools_database.json")
+FIXTURES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures")
+PAGES_DIR = os.path.join(FIXTURES_DIR, "pages")
+DATABASES_DIR = os.path.join(FIXTURES_DIR, "databases")
+SEED_SIZE = 1000
+DATABASE_SIZES = [1000, 10_000, 100_000]
+
+PRICING_LABELS = {
+    'FREE': 'Free',
+    'PAID': 'Paid',
+    'FREEMIUM': 'Freemium',
+    'FREE + PAID': 'Free + Paid',
+    'WITH ATTRIBUTION': 'With attribution',
+}
+
+TRAILING_PRICING = re.compile(r'(Free \+ Paid|With attribution|Freemium|Free|Paid)$')
+
+# Stand-in for the framework CSS/JS every real page ships in <head>
+PAGE_HEAD = "".join(
+    f".w-layout-grid-{i}{{display:grid;grid-row-gap:16px;grid-column-gap:16px;"
+    f"grid-template-columns:repeat({i % 4 + 1},1fr)}}\n" for i in range(120)
+)
+PAGE_SCRIPT = "".join(
+    f"window.Webflow&&window.Webflow.push(function(){{var e{i}=document.querySelectorAll('[data-w-id=\"{i}\"]');}});\n"
+    for i in range(80)
+)
+
+
+def render_card(tool):
+    """Render one tool as a collection item card"""
+    description = TRAILING_PRICING.sub('', tool.get('description', '')).strip()
+    pricing = PRICING_LABELS.get(tool.get('pricing'), 'Free')
+    return (
+        '<div role="listitem" class="collection-item w-dyn-item">'
+        f'<a href="{html.escape(tool["url"])}" target="_blank" class="tool-card w-inline-block">'
+        f'<img src="{html.escape(tool.get("image", ""))}" loading="lazy" alt="" class="tool-logo"/>'
+        '<div class="tool-card-content">'
+        f'<h3 class="tool-name">{html.escape(tool["name"])}</h3>'
+        f'<p class="tool-description">{html.escape(description)}</p>'
+        '</div>'
+        f'<div class="pricing-tag">{pricing}</div>'
+        '</a></div>\n'
+    )
+
+
+def render_page(category_info, tools, categories):
+    """Render a full category page around its tool cards"""
+    nav = "".join(
+        f'<a href="{info["urls"][0]}" class="nav-link w-nav-link">{html.escape(info["name"])}</a>'
+        for info in categories.values()
+    )
+    cards = "".join(render_card(tool) for tool in tools)
+    return (
+        '<!DOCTYPE html><html data-wf-site="toools"><head><meta charset="utf-8"/>'
+        f'<title>{html.escape(category_info["name"])} | Toools.design</title>'
+        f'<style>{PAGE_HEAD}</style></head><body>'
+        f'<div class="navbar w-nav"><a href="{BASE_URL}/" class="brand w-nav-brand">Home</a>'
+        f'<nav class="nav-menu w-nav-menu">{nav}</nav></div>'
+        f'<div class="hero"><h1>{html.escape(category_info["name"])}</h1>'
+        f'<p>{html.escape(category_info["description"])}</p>'
+        '<a href="#list" class="button">Browse</a></div>'
+        f'<div id="list" class="collection-list w-dyn-items">\n{cards}</div>'
+        f'<footer class="footer"><a href="{BASE_URL}/deals">Deals</a><a href="{BASE_URL}/blog">Blog</a></footer>'
+        f'<script>{PAGE_SCRIPT}</script></body></html>\n'
+    )
+
+
+def make_fixtures():
+    """Write one saved page per category into fixtures/pages"""
+    with open(DATABASE_FILE, 'r', encoding='utf-8') as f:
+        database = json.load(f)
+
+    categories = get_categories()
+    os.makedirs(PAGES_DIR, exist_ok=True)
+
+    for category_key, category_info in categories.items():
+        tools = database['categories'].get(category_key, {}).get('tools', [])
+        page = render_page(category_info, tools, categories)
+        path = os.path.join(PAGES_DIR, f"{category_key}.html")
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write(page)
+        print(f"Wrote {os.path.relpath(path, ROOT)} ({len(tools)} tools, {len(page) // 1024} KB)")
+
+
+def database_path(size):
+    return os.path.join(DATABASES_DIR, f"tools-{size // 1000}k.json")
+
+
+def grow_database(database, size):
+    """Scale every category of database to size tools in total.
+
+    Tools are repeated round-robin within their category; repeats get a
+    numbered name and URL path so they stay distinct tools (for dedupe and
+    the override matcher) while keeping realistic field lengths.
+    """
+    current = sum(len(category['tools']) for category in database['categories'].values())
+    categories = {}
+    assigned = 0
+    items = list(database['categories'].items())
+    for i, (category_key, category) in enumerate(items):
+        source = category['tools']
+        if i == len(items) - 1:
+            target = size - assigned
+        else:
+            target = round(len(source) * size / current)
+        assigned += target
+        tools = []
+        for n in range(target):
+            tool = source[n % len(source)]
+            copy = n // len(source)
+            if copy:
+                tool = {**tool, 'name': f"{tool['name']} {copy + 1}",
+                        'url': f"{tool['url'].rstrip('/')}/{copy + 1}"}
+            tools.append(tool)
+        categories[category_key] = {**category, 'tools': tools}
+    return {'meta': {**database['meta'], 'total_tools': size}, 'categories': categories}
+
+
+def load_database(size):
+    """The synthetic database of size tools, generating and caching it if needed"""
+    path = database_path(size)
+    if not os.path.exists(path):
+        with open(database_path(SEED_SIZE), 'r', encoding='utf-8') as f:
+            seed = json.load(f)
+        os.makedirs(DATABASES_DIR, exist_ok=True)
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(grow_database(seed, size), f, indent=2, ensure_ascii=False)
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def make_seed_database():
+    """Write the checked-in seed database, grown from the current database"""
+    with open(DATABASE_FILE, 'r', encoding='utf-8') as f:
+        database = json.load(f)
+    os.makedirs(DATABASES_DIR, exist_ok=True)
+    path = database_path(SEED_SIZE)
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(grow_database(database, SEED_SIZE), f, indent=2, ensure_ascii=False)
+    print(f"Wrote {os.path.relpath(path, ROOT)} ({SEED_SIZE} tools)")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Regenerate the benchmark fixtures")
+    parser.add_argument("--pages", action="store_true", help="Re-render the saved category pages")
+    parser.add_argument("--seed", action="store_true", help="Rewrite the seed database from the current data")
+    args = parser.parse_args()
+
+    if args.pages or not args.seed:
+        make_fixtures()
+    if args.seed:
+        make_seed_database()
@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+"""
+URL canonicalization and cross-category duplicate detection.
+
+Tools are identified by a canonical form of their URL: https, lower-case host
+without www., no default port, no fragment, tracking/affiliate parameters
+removed, remaining parameters sorted and no trailing slash. Tools sharing a
+canonical URL are collapsed into the first record, which lists every category
+it belongs to in 'categories'.
+"""
+
+import argparse
+import hashlib
+import json
+from urllib.parse import parse_qsl, urlencode, urlsplit
+
+from db_writer import write_database
+from search_index import write_index
+
+DATABASE_FILE = "data/design_tools_database.json"
+
+# Query parameters that only identify the referrer, never the page
+TRACKING_PARAMS = frozenset([
+    'via', 'ref', 'ref_', 'ref_src', 'referrer', 'aff', 'affiliate', 'fpr',
+    'fbclid', 'gclid', 'dclid', 'msclkid', 'mc_cid', 'mc_eid', '_hsenc', '_hsmi',
+    # Amazon associate links
+    'tag', 'linkcode', 'linkid', 'camp', 'creative', 'creativeasin', 'ie',
+])
+TRACKING_PREFIXES = ('utm_',)
+
+DEFAULT_PORTS = {'http': 80, 'https': 443}
+
+
+def is_tracking_param(name):
+    """True for referrer and campaign parameters"""
+    name = name.lower()
+    return name in TRACKING_PARAMS or name.startswith(TRACKING_PREFIXES)
+
+
+def canonicalize_url(url):
+    """Canonical form of a tool URL, or None if it has no host"""
+    try:
+        parts = urlsplit((url or '').strip())
+        port = parts.port
+    except ValueError:
+        return None
+    host = (parts.hostname or '').lower()
+    if not host:
+        return None
+    if host.startswith('www.'):
+        host = host[4:]
+    scheme = parts.scheme.lower()
+    if port and port != DEFAULT_PORTS.get(scheme):
+        host = f"{host}:{port}"
+
+    query = sorted((name, value) for name, value in parse_qsl(parts.query, keep_blank_values=True)
+                   if not is_tracking_param(name))
+    path = parts.path.rstrip('/')
+    canonical = f"https://{host}{path}"
+    if query:
+        canonical += '?' + urlencode(query)
+    return canonical
+
+
+def tool_id(tool):
+    """Stable id of a tool: a hash of its canonical URL (of its name when it has no usable URL)"""
+    key = canonicalize_url(tool.get('url')) or 'name:' + (tool.get('name') or '').strip().lower()
+    return hashlib.sha256(key.encode('utf-8')).hexdigest()[:16]
+
+
+def dedupe_tools(database):
+    """Collapse tools that share a canonical URL, within and across categories.
+
+    The first occurrence (in category order) is kept and, when the tool was
+    listed in more than one category, records them all in 'categories'.
+    Returns (database, removed_count); the input is not modified.
+    """
+    index = {}
+    categories = {}
+    removed = 0
+
+    for category_key, category in database['categories'].items():
+        kept = []
+        for tool in category['tools']:
+            key = canonicalize_url(tool.get('url'))
+            if key is None:
+                kept.append(tool)
+                continue
+            primary = index.get(key)
+            if primary is None:
+                tool = tool.copy()
+                tool['categories'] = list(tool.get('categories') or [category_key])
+                index[key] = tool
+                kept.append(tool)
+                continue
+            for member in tool.get('categories') or [category_key]:
+                if member not in primary['categories']:
+                    primary['categories'].append(member)
+            removed += 1
+        categories[category_key] = {**category, 'tools': kept}
+
+    # Single-category tools keep the original record shape
+    for tool in index.values():
+        if len(tool['categories']) == 1:
+            del tool['categories']
+
+    total_tools = sum(len(category['tools']) for category in categories.values())
+    deduped = {**database, 'meta': {**database['meta'], 'total_tools': total_tools}, 'categories': categories}
+    return deduped, removed
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Collapse duplicate tools by canonical URL")
+    parser.add_argument("--database", default=DATABASE_FILE, help="Database JSON to deduplicate")
+    args = parser.parse_args()
+
+    with open(args.database, 'r', encoding='utf-8') as f:
+        database = json.load(f)
+
+    database, removed = dedupe_tools(database)
+    print(f"Collapsed {removed} duplicate tools; {database['meta']['total_tools']} unique tools remain")
+    write_database(database)
+    write_index(database)
@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+"""
+Append-only change feed between consecutive database builds.
+
+Every build that changes any tool gets the next build number (also stored
+as meta.build in the database) and appends one JSON line per change to
+public/changes.jsonl, followed by a line closing the build:
+
+    {"build": 7, "op": "add", "id": "...", "tool": {...}}
+    {"build": 7, "op": "modify", "id": "...", "url": "...", "fields": {"pricing": {"old": "FREE", "new": "PAID"}}}
+    {"build": 7, "op": "remove", "id": "...", "url": "...", "name": "..."}
+    {"build": 7, "op": "build", "at": "...", "added": 1, "removed": 1, "modified": 1, "total_tools": 1693}
+
+Tools are keyed by canonical.tool_id() (a hash of the canonical URL) and
+carry the key of their category as the 'category' field, so a move between
+categories is a modification. A consumer at build N applies the lines of
+builds N+1.. whose closing line is present and ends up with the current
+database without reloading it.
+
+Each build is diffed against a snapshot of the last build that went into
+the feed (.cache/feed_snapshot.json), not against the database on disk, so
+changes written between feed builds by the standalone scripts still reach
+the feed with the next one.
+"""
+
+import json
+import os
+from datetime import datetime, timezone
+
+from canonical import tool_id
+
+FEED_FILE = "public/changes.jsonl"
+SNAPSHOT_FILE = ".cache/feed_snapshot.json"
+
+# Enough of the feed's tail to hold its last line
+TAIL_SIZE = 1 << 16
+
+
+def snapshot(database):
+    """{tool id: tool with its category key} of a database, first occurrence of an id wins"""
+    tools = {}
+    for category_key, category in database['categories'].items():
+        for tool in category['tools']:
+            tools.setdefault(tool_id(tool), {'category': category_key, **tool})
+    return tools
+
+
+def field_changes(old, new):
+    """{field: {'old': ..., 'new': ...}} for the fields that differ; a missing side is left out"""
+    fields = {}
+    for key in list(old) + [key for key in new if key not in old]:
+        if old.get(key) == new.get(key) and (key in old) == (key in new):
+            continue
+        change = {}
+        if key in old:
+            change['old'] = old[key]
+        if key in new:
+            change['new'] = new[key]
+        fields[key] = change
+    return fields
+
+
+def diff_snapshots(old, new):
+    """Change records (without build numbers) turning snapshot old into snapshot new"""
+    changes = []
+    for key, tool in new.items():
+        if key not in old:
+            changes.append({'op': 'add', 'id': key, 'tool': tool})
+        elif tool != old[key]:
+            changes.append({'op': 'modify', 'id': key, 'url': tool.get('url'),
+                            'fields': field_changes(old[key], tool)})
+    for key, tool in old.items():
+        if key not in new:
+            changes.append({'op': 'remove', 'id': key, 'url': tool.get('url'), 'name': tool.get('name')})
+    return changes
+
+
+def summarize(changes):
+    ops = [change['op'] for change in changes]
+    return {'added': ops.count('add'), 'removed': ops.count('remove'), 'modified': ops.count('modify')}
+
+
+def last_build(path=FEED_FILE):
+    """Highest build number in the feed, 0 if there is none.
+
+    A build cut short by a crash counts too, so its number is never reused.
+    """
+    try:
+        with open(path, 'rb') as f:
+            f.seek(0, os.SEEK_END)
+            f.seek(max(0, f.tell() - TAIL_SIZE))
+            tail = f.read().decode('utf-8', errors='replace')
+    except FileNotFoundError:
+        return 0
+    for line in reversed(tail.splitlines()):
+        try:
+            record = json.loads(line)
+        except ValueError:
+            continue
+        if isinstance(record, dict) and 'build' in record:
+            return record['build']
+    return 0
+
+
+def append_build(build, changes, total_tools, path=FEED_FILE):
+    """Append one build's changes and its closing line in a single durable write"""
+    lines = [{'build': build, **change} for change in changes]
+    lines.append({'build': build, 'op': 'build', 'at': datetime.now(timezone.utc).isoformat(timespec='seconds'),
+                  **summarize(changes), 'total_tools': total_tools})
+    payload = ''.join(json.dumps(line, ensure_ascii=False) + '\n' for line in lines)
+
+    os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+    with open(path, 'a+b') as f:
+        # Start on a fresh line after a torn write
+        if f.tell():
+            f.seek(-1, os.SEEK_END)
+            if f.read(1) != b'\n':
+                payload = '\n' + payload
+        data = payload.encode('utf-8')
+        f.write(data)
+        f.flush()
+        os.fsync(f.fileno())
+    return len(data)
+
+
+def load_snapshot(path=SNAPSHOT_FILE):
+    """(build, snapshot) of the last build appended to the feed, or None if there is none"""
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            stored = json.load(f)
+        return stored['build'], stored['tools']
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
+
+
+def save_snapshot(build, tools, path=SNAPSHOT_FILE):
+    """Store the snapshot of the build just appended to the feed"""
+    os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+    tmp_path = path + '.tmp'
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump({'build': build, 'tools': tools}, f, ensure_ascii=False, separators=(',', ':'))
+    os.replace(tmp_path, path)
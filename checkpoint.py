@@ -0,0 +1,56 @@
+#!/usr/bin/env python3
+"""
+Append-only JSONL checkpoint journal for resumable crawls
+"""
+
+import json
+import os
+import threading
+
+
+class CheckpointJournal:
+    """One JSON record per finished unit of work, keyed by a record field"""
+
+    def __init__(self, path, key='category'):
+        self.path = path
+        self.key = key
+        self._lock = threading.Lock()
+
+    def load(self):
+        """Return the recorded entries by key; later records win, a torn last line is ignored"""
+        records = {}
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                for line in f:
+                    try:
+                        record = json.loads(line)
+                    except ValueError:
+                        continue
+                    records[record[self.key]] = record
+        except FileNotFoundError:
+            pass
+        return records
+
+    def append(self, record):
+        """Durably add one record so a crash right after still keeps it"""
+        line = json.dumps(record, ensure_ascii=False) + '\n'
+        with self._lock:
+            os.makedirs(os.path.dirname(self.path) or '.', exist_ok=True)
+            with open(self.path, 'a', encoding='utf-8') as f:
+                f.write(line)
+                f.flush()
+                os.fsync(f.fileno())
+
+    def reset(self):
+        """Start a fresh journal"""
+        with self._lock:
+            os.makedirs(os.path.dirname(self.path) or '.', exist_ok=True)
+            open(self.path, 'w').close()
+
+    def remove(self):
+        """Delete the journal once its run has completed"""
+        with self._lock:
+            try:
+                os.remove(self.path)
+            except FileNotFoundError:
+                pass
@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+"""
+Bounded concurrent crawling with per-host rate limiting
+"""
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from urllib.parse import urlparse
+
+
+class HostRateLimiter:
+    """Space out request start times per host so concurrent workers stay polite"""
+
+    def __init__(self, requests_per_second=2.0):
+        self.interval = 1.0 / requests_per_second if requests_per_second > 0 else 0.0
+        self._next_slot = {}
+        self._lock = threading.Lock()
+
+    def wait(self, url):
+        """Block until the host of url may receive another request"""
+        if not self.interval:
+            return
+        host = urlparse(url).netloc.lower()
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_slot.get(host, now))
+            self._next_slot[host] = slot + self.interval
+        delay = slot - now
+        if delay > 0:
+            time.sleep(delay)
+
+
+def crawl(jobs, worker, max_workers=4):
+    """Run worker(*job) for each job tuple in a bounded pool.
+
+    Results come back as a list in the same order as jobs, regardless of
+    which job finished first.
+    """
+    jobs = list(jobs)
+
+    if max_workers <= 1:
+        return [worker(*job) for job in jobs]
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(lambda job: worker(*job), jobs))
+
+
+def crawl_completed(jobs, worker, max_workers=4):
+    """Run worker(*job) for each job tuple in a bounded pool, yielding results as jobs finish.
+
+    Results come in completion order, so the caller can act on each one
+    (e.g. checkpoint it) while the other jobs are still running. Jobs not
+    yet started are cancelled if the caller stops early.
+    """
+    jobs = list(jobs)
+
+    if max_workers <= 1:
+        for job in jobs:
+            yield worker(*job)
+        return
+
+    executor = ThreadPoolExecutor(max_workers=max_workers)
+    try:
+        for future in as_completed([executor.submit(worker, *job) for job in jobs]):
+            yield future.result()
+    finally:
+        executor.shutdown(cancel_futures=True)
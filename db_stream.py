@@ -0,0 +1,255 @@
+#!/usr/bin/env python3
+"""
+Stream the tools database one category at a time.
+
+iter_categories() reads the top-level object incrementally and decodes one
+category at a time, so a pass over the database never holds more than the
+category being worked on plus whatever the pass itself builds. Transforms
+are generator stages over (category_key, category) pairs, and
+write_stream() writes the result the same way. Its output is byte-identical
+to db_writer.serialize(), so unchanged copies are still left untouched.
+"""
+
+import json
+import os
+import tempfile
+
+from db_writer import (DATABASE_TARGETS, MINIFIED_FILE, NORMALIZED_FILE, SHARDS_DIR, Normalizer,
+                       expand_memberships, write_file_targets, write_manifest, write_shard)
+from derived_views import views_from_categories, write_views
+from search_index import index_categories, write_index_document
+from instrumentation import record_category
+
+READ_SIZE = 1 << 16
+WHITESPACE = ' \t\n\r'
+
+# Stands in for the categories object when the rest of the document is serialized
+_CATEGORIES_SLOT = '\0categories\0'
+
+
+class _Reader:
+    """Buffered character reader that decodes one JSON value at a time"""
+
+    def __init__(self, f):
+        self.f = f
+        self.buffer = ''
+        self.pos = 0
+        self.eof = False
+
+    def _fill(self, size=READ_SIZE):
+        if self.eof:
+            return False
+        chunk = self.f.read(size)
+        if not chunk:
+            self.eof = True
+            return False
+        self.buffer = self.buffer[self.pos:] + chunk
+        self.pos = 0
+        return True
+
+    def peek(self):
+        """Next non-whitespace character, or '' at end of input"""
+        while True:
+            while self.pos < len(self.buffer) and self.buffer[self.pos] in WHITESPACE:
+                self.pos += 1
+            if self.pos < len(self.buffer) or not self._fill():
+                return self.buffer[self.pos:self.pos + 1]
+
+    def expect(self, char):
+        found = self.peek()
+        if found != char:
+            raise ValueError(f"expected {char!r}, found {found or 'end of input'!r}")
+        self.pos += 1
+
+    def value(self):
+        """Decode the next complete JSON value, reading more input as needed"""
+        self.peek()
+        decoder = json.JSONDecoder()
+        size = READ_SIZE
+        while True:
+            try:
+                value, end = decoder.raw_decode(self.buffer, self.pos)
+            except json.JSONDecodeError:
+                # Incomplete value: read a growing amount so long values stay linear
+                if not self._fill(size):
+                    raise
+                size *= 2
+                continue
+            # A number can be cut off at the buffer end and still decode
+            if end == len(self.buffer) and not self.eof and self._fill():
+                continue
+            self.pos = end
+            return value
+
+    def members(self):
+        """Yield the key of each member of the object at the cursor.
+
+        The caller consumes the member's value before asking for the next one.
+        """
+        self.expect('{')
+        if self.peek() == '}':
+            self.pos += 1
+            return
+        while True:
+            key = self.value()
+            self.expect(':')
+            yield key
+            if self.peek() == ',':
+                self.pos += 1
+                continue
+            self.expect('}')
+            return
+
+
+def iter_categories(path, head=None):
+    """Yield (category_key, category) from a database file one at a time.
+
+    Top-level members other than 'categories' (such as 'meta') are stored in
+    head, in document order, with 'categories' keeping its position. Members
+    that come after the categories are only there once the generator is
+    exhausted.
+    """
+    head = {} if head is None else head
+    with open(path, 'r', encoding='utf-8') as f:
+        reader = _Reader(f)
+        for key in reader.members():
+            if key != 'categories':
+                head[key] = reader.value()
+                continue
+            head['categories'] = _CATEGORIES_SLOT
+            for category_key in reader.members():
+                yield category_key, reader.value()
+
+
+def map_tools(categories, transform):
+    """Stage applying transform(tool, category_key) to every tool.
+
+    The transform returns the tool to keep (the same or a new dict) or None
+    to drop it.
+    """
+    for category_key, category in categories:
+        tools = []
+        for tool in category['tools']:
+            tool = transform(tool, category_key)
+            if tool is not None:
+                tools.append(tool)
+        yield category_key, {**category, 'tools': tools}
+
+
+def _indent(text, prefix):
+    """Indent every line after the first, as json.dumps nesting does"""
+    return text.replace('\n', '\n' + prefix)
+
+
+def _dumps(value, pretty):
+    """db_writer.serialize (pretty) or serialize_minified formatting, as text"""
+    if pretty:
+        return json.dumps(value, indent=2, ensure_ascii=False)
+    return json.dumps(value, separators=(',', ':'), ensure_ascii=False)
+
+
+class _CategoriesBody:
+    """Temp file holding one output's categories object, written a member at a time"""
+
+    def __init__(self, pretty):
+        self.pretty = pretty
+        self.file = tempfile.TemporaryFile('w+', encoding='utf-8', newline='')
+        self.file.write('{')
+        self.count = 0
+
+    def add(self, category_key, category):
+        key = json.dumps(category_key, ensure_ascii=False)
+        if self.pretty:
+            self.file.write(',\n    ' if self.count else '\n    ')
+            self.file.write(key + ': ' + _indent(_dumps(category, True), '    '))
+        else:
+            self.file.write((',' if self.count else '') + key + ':' + _dumps(category, False))
+        self.count += 1
+
+    def write(self, document, paths):
+        """Write document, with this body in place of its categories slot, to paths"""
+        self.file.write('\n  }' if self.pretty and self.count else '}')
+        before, after = _dumps(document, self.pretty).split(json.dumps(_CATEGORIES_SLOT), 1)
+
+        directory = os.path.dirname(paths[0]) or '.'
+        os.makedirs(directory, exist_ok=True)
+        fd, assembled = tempfile.mkstemp(dir=directory, prefix='.stream.', suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8', newline='') as out:
+                out.write(before)
+                self.file.seek(0)
+                for chunk in iter(lambda: self.file.read(READ_SIZE), ''):
+                    out.write(chunk)
+                out.write(after)
+            return write_file_targets(assembled, paths)
+        finally:
+            os.remove(assembled)
+            self.file.close()
+
+
+def write_stream(categories, head, paths=DATABASE_TARGETS, shards_dir=SHARDS_DIR, compact=True):
+    """Write a stream of categories to every path, one category at a time.
+
+    head supplies the other top-level members (as filled in by
+    iter_categories); meta.total_tools is recomputed. Categories are written
+    to a temp file as they arrive and the document is assembled around them
+    once the meta is known. With compact=True the minified and normalized
+    variants are assembled the same way, so every copy write_database()
+    would write matches it byte for byte. Per-category shards and their
+    manifest are written along the way when shards_dir is set; tools
+    collapsed into an earlier category are added to the shards of the later
+    categories they list (db_writer.expand_memberships). Returns (paths
+    written, total tools).
+    """
+    written = []
+    entries = {}
+    total_tools = 0
+    pretty = _CategoriesBody(pretty=True)
+    minified = _CategoriesBody(pretty=False) if compact else None
+    normalized = _CategoriesBody(pretty=False) if compact else None
+    normalizer = Normalizer()
+
+    def counted(categories):
+        nonlocal total_tools
+        for category_key, category in categories:
+            pretty.add(category_key, category)
+            if compact:
+                minified.add(category_key, category)
+                normalized.add(category_key, normalizer.rows(category))
+            total_tools += len(category['tools'])
+            record_category(category_key, tools=len(category['tools']))
+            yield category_key, category
+
+    for category_key, shard, _ in expand_memberships(counted(categories)):
+        if shards_dir:
+            os.makedirs(shards_dir, exist_ok=True)
+            shard_written, entries[category_key] = write_shard(category_key, shard, shards_dir)
+            written += shard_written
+
+    document = dict(head)
+    document.setdefault('categories', _CATEGORIES_SLOT)
+    if 'meta' in document:
+        document['meta'] = {**document['meta'], 'total_tools': total_tools}
+    written += pretty.write(document, paths)
+    if compact:
+        written += minified.write(document, [MINIFIED_FILE])
+        written += normalized.write(normalizer.document(document.get('meta'), _CATEGORIES_SLOT), [NORMALIZED_FILE])
+
+    if shards_dir:
+        written += write_manifest(document.get('meta', {}), entries, shards_dir)
+    return written, total_tools
+
+
+def write_derived_stream(path=DATABASE_TARGETS[0]):
+    """Rebuild the search index and the derived views from a database file.
+
+    Each is built from its own pass over the file, one category at a time,
+    so the decoded document is never held. The index and the comprehensive
+    view still cover every tool, so each pass holds O(total tools). The
+    views need the meta, which is known once the index pass has read the
+    whole file.
+    """
+    head = {}
+    write_index_document(index_categories(iter_categories(path, head)))
+    tools_index, comprehensive = views_from_categories(iter_categories(path), head.get('meta', {}))
+    return write_views(tools_index, comprehensive)
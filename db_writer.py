@@ -0,0 +1,338 @@
+#!/usr/bin/env python3
+"""
+Serialize the tools database once and write every copy atomically, plus
+compact production variants for the browser
+"""
+
+import gzip
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+import time
+from collections.abc import Mapping
+
+from instrumentation import count, record_category, timer
+
+# Every place the site and the scripts read the database from
+DATABASE_TARGETS = [
+    "data/design_tools_database.json",
+    "public/design_tools_database.json",
+    "src/data/design_tools_database.json",
+]
+
+# Compact variants shipped to browsers next to the pretty-printed copy
+MINIFIED_FILE = "public/design_tools_database.min.json"
+NORMALIZED_FILE = "public/design_tools_database.normalized.json"
+
+# One minified file per category plus a manifest, so a page loads only its own category
+SHARDS_DIR = "public/categories"
+MANIFEST_FILE = "manifest.json"
+
+# Column order of tool rows in the normalized variant; the last column
+# (the categories of a tool collapsed by dedupe) is only present when set
+TOOL_FIELDS = ['name', 'description', 'image', 'url', 'pricing', 'use_cases', 'categories']
+NORMALIZED_FORMAT = 2
+
+HASH_CHUNK = 1 << 20
+
+
+def _mapping(value):
+    """json default: mappings that are not dicts (records.py records) are written as dicts"""
+    if isinstance(value, Mapping):
+        return dict(value)
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def serialize(database):
+    """Pretty-printed UTF-8 bytes, matching json.dump(indent=2, ensure_ascii=False)"""
+    return json.dumps(database, indent=2, ensure_ascii=False, default=_mapping).encode('utf-8')
+
+
+def file_hash(path):
+    """sha256 of a file's contents, or None if it does not exist"""
+    digest = hashlib.sha256()
+    try:
+        with open(path, 'rb') as f:
+            for chunk in iter(lambda: f.read(HASH_CHUNK), b''):
+                digest.update(chunk)
+    except FileNotFoundError:
+        return None
+    return digest.hexdigest()
+
+
+def write_atomic(path, payload):
+    """Write bytes to path via a temp file in the same directory and os.replace"""
+    _replace_atomic(path, lambda f: f.write(payload))
+
+
+def _replace_atomic(path, fill):
+    """Call fill(file) on a temp file next to path, fsync it and move it into place"""
+    directory = os.path.dirname(path) or '.'
+    os.makedirs(directory, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=directory, prefix='.' + os.path.basename(path) + '.', suffix='.tmp')
+    try:
+        # mkstemp creates 0600 files; keep the published files world-readable
+        try:
+            mode = os.stat(path).st_mode & 0o777
+        except FileNotFoundError:
+            mode = 0o644
+        os.chmod(tmp_path, mode)
+        with os.fdopen(fd, 'wb') as f:
+            fill(f)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.remove(tmp_path)
+        except FileNotFoundError:
+            pass
+        raise
+
+
+def write_targets(payload, paths):
+    """Write payload to each path whose current content differs.
+
+    Returns the list of paths that were actually rewritten; untouched files
+    keep their mtime so build caches watching them stay valid.
+    """
+    digest = hashlib.sha256(payload).hexdigest()
+    written = []
+    with timer('write'):
+        for path in paths:
+            if file_hash(path) == digest:
+                continue
+            write_atomic(path, payload)
+            written.append(path)
+            count('files_written')
+            count('bytes_written', len(payload))
+    return written
+
+
+def write_file_targets(source_path, paths):
+    """Like write_targets, but copies the payload from a file instead of holding it in memory"""
+    digest = file_hash(source_path)
+    written = []
+    for path in paths:
+        if file_hash(path) == digest:
+            continue
+
+        def fill(f):
+            with open(source_path, 'rb') as source:
+                shutil.copyfileobj(source, f)
+
+        _replace_atomic(path, fill)
+        written.append(path)
+    return written
+
+
+def serialize_minified(data):
+    """UTF-8 bytes with no indentation or separator whitespace"""
+    return json.dumps(data, separators=(',', ':'), ensure_ascii=False, default=_mapping).encode('utf-8')
+
+
+class Normalizer:
+    """Interns pricing strings and use-case lists while categories are turned into rows.
+
+    Categories can be fed one at a time (see db_stream); the tables are
+    complete once every category has been passed through rows().
+    """
+
+    def __init__(self):
+        self.pricing = []
+        self.use_cases = []
+        self._pricing_index = {}
+        self._use_case_index = {}
+
+    @staticmethod
+    def _intern(value, table, index):
+        key = tuple(value) if isinstance(value, list) else value
+        if key not in index:
+            index[key] = len(table)
+            table.append(value)
+        return index[key]
+
+    def rows(self, category):
+        """The category with its tools as rows"""
+        field_set = set(TOOL_FIELDS[:-1])
+        member_field_set = set(TOOL_FIELDS)
+        rows = []
+        for tool in category['tools']:
+            keys = set(tool)
+            if keys != field_set and keys != member_field_set:
+                rows.append(tool)
+                continue
+            row = [
+                tool['name'],
+                tool['description'],
+                tool['image'],
+                tool['url'],
+                self._intern(tool['pricing'], self.pricing, self._pricing_index),
+                self._intern(tool['use_cases'], self.use_cases, self._use_case_index),
+            ]
+            if 'categories' in tool:
+                row.append(tool['categories'])
+            rows.append(row)
+        return {**category, 'tools': rows}
+
+    def document(self, meta, categories):
+        """The normalized document around already converted categories"""
+        return {
+            'format': NORMALIZED_FORMAT,
+            'meta': meta,
+            'tool_fields': TOOL_FIELDS,
+            'pricing': self.pricing,
+            'use_cases': self.use_cases,
+            'categories': categories,
+        }
+
+
+def normalize(database):
+    """Intern pricing strings and use-case lists into lookup tables.
+
+    Tools become rows in TOOL_FIELDS order whose pricing and use_cases hold
+    indexes into the 'pricing' and 'use_cases' tables; rows of tools without
+    'categories' stop before that column. A tool with any other set of keys
+    is kept as a plain object so the conversion stays lossless.
+    """
+    normalizer = Normalizer()
+    categories = {key: normalizer.rows(category) for key, category in database['categories'].items()}
+    return normalizer.document(database['meta'], categories)
+
+
+def denormalize(normalized):
+    """Rebuild the regular database shape from normalize() output"""
+    pricing_table = normalized['pricing']
+    use_case_table = normalized['use_cases']
+    fields = normalized['tool_fields']
+
+    categories = {}
+    for category_key, category in normalized['categories'].items():
+        tools = []
+        for row in category['tools']:
+            if isinstance(row, dict):
+                tools.append(row)
+                continue
+            tool = dict(zip(fields, row))
+            tool['pricing'] = pricing_table[tool['pricing']]
+            tool['use_cases'] = list(use_case_table[tool['use_cases']])
+            tools.append(tool)
+        categories[category_key] = {**category, 'tools': tools}
+
+    return {'meta': normalized['meta'], 'categories': categories}
+
+
+def expand_memberships(categories):
+    """Yield (category_key, category, own) with collapsed tools added to their other categories.
+
+    dedupe_tools stores a tool listed in several categories once, in the
+    first, with a 'categories' list; anything that presents one category
+    on its own (shards, per-category views) needs the tool in each of them.
+    Those tools are appended after the category's own first `own` tools.
+    Works on a stream of (key, category) pairs: the first category is the
+    earliest, so every other category a tool names is still to come.
+    """
+    pending = {}
+    for category_key, category in categories:
+        for tool in category['tools']:
+            for member in tool.get('categories') or []:
+                if member != category_key:
+                    pending.setdefault(member, []).append(tool)
+        own = len(category['tools'])
+        members = pending.pop(category_key, None)
+        if members:
+            category = {**category, 'tools': category['tools'] + members}
+        yield category_key, category, own
+
+
+def write_shards(database, directory=SHARDS_DIR):
+    """Write one shard per category key and a manifest describing them.
+
+    Shards list every tool of their category, including tools stored under
+    another category (see expand_memberships). They are only rewritten when
+    their content changes, and shards of categories that disappeared are
+    removed. Returns the paths written.
+    """
+    written = []
+    entries = {}
+    os.makedirs(directory, exist_ok=True)
+
+    for category_key, category, _ in expand_memberships(database['categories'].items()):
+        shard_written, entries[category_key] = write_shard(category_key, category, directory)
+        written += shard_written
+
+    written += write_manifest(database['meta'], entries, directory)
+    return written
+
+
+def write_shard(category_key, category, directory=SHARDS_DIR):
+    """Write one category's shard; returns (paths written, manifest entry)"""
+    filename = f"{category_key}.json"
+    payload = serialize_minified({'key': category_key, **category})
+    written = write_targets(payload, [os.path.join(directory, filename)])
+    entry = {
+        'name': category['name'],
+        'description': category['description'],
+        'count': len(category['tools']),
+        'shard': filename,
+        'hash': hashlib.sha256(payload).hexdigest(),
+    }
+    return written, entry
+
+
+def write_manifest(meta, entries, directory=SHARDS_DIR):
+    """Write the shard manifest and remove shards of categories not in entries"""
+    shard_files = {entry['shard'] for entry in entries.values()}
+    for filename in os.listdir(directory):
+        if filename.endswith('.json') and filename != MANIFEST_FILE and filename not in shard_files:
+            os.remove(os.path.join(directory, filename))
+            print(f"Removed stale shard: {filename}")
+
+    manifest = {'meta': meta, 'categories': entries}
+    return write_targets(serialize(manifest), [os.path.join(directory, MANIFEST_FILE)])
+
+
+def size_report(payloads):
+    """Print raw size, gzip size and json.loads time for each named payload"""
+    baseline = None
+    print(f"{'variant':<12}{'bytes':>10}{'gzip':>10}{'parse':>10}{'vs pretty':>11}")
+    for name, payload in payloads:
+        start = time.perf_counter()
+        json.loads(payload)
+        parse_ms = (time.perf_counter() - start) * 1000
+        baseline = baseline or len(payload)
+        print(f"{name:<12}{len(payload):>10,}{len(gzip.compress(payload)):>10,}"
+              f"{parse_ms:>8.1f}ms{len(payload) / baseline:>10.0%}")
+
+
+def write_database(database, paths=DATABASE_TARGETS, compact=True, report=True):
+    """Serialize the database once and write it to every target that changed.
+
+    With compact=True the minified and normalized production variants and
+    the per-category shards are written alongside the pretty-printed copies.
+    """
+    for category_key, category in database['categories'].items():
+        record_category(category_key, tools=len(category['tools']))
+    with timer('serialize'):
+        pretty = serialize(database)
+    written = write_targets(pretty, paths)
+
+    if compact:
+        minified = serialize_minified(database)
+        normalized = serialize_minified(normalize(database))
+        written += write_targets(minified, [MINIFIED_FILE])
+        written += write_targets(normalized, [NORMALIZED_FILE])
+        paths = list(paths) + [MINIFIED_FILE, NORMALIZED_FILE]
+        if report:
+            size_report([('pretty', pretty), ('minified', minified), ('normalized', normalized)])
+
+    for path in paths:
+        print(f"{'Updated' if path in written else 'Unchanged'}: {path}")
+
+    if compact:
+        shards_written = write_shards(database)
+        print(f"Category shards: {len(shards_written)} updated in {SHARDS_DIR}")
+        written += shards_written
+    return written
@@ -0,0 +1,164 @@
+#!/usr/bin/env python3
+"""
+Generate the derived views of the tools database in one pass:
+
+- tools_index.json: tools grouped by purpose, names by pricing, counts per category
+- comprehensive_database.json: per-category summaries with pricing counts
+"""
+
+import argparse
+import json
+
+from db_writer import expand_memberships, serialize, write_targets
+
+DATABASE_FILE = "data/design_tools_database.json"
+TOOLS_INDEX_TARGETS = ["data/tools_index.json", "src/data/tools_index.json"]
+COMPREHENSIVE_TARGETS = ["data/comprehensive_database.json", "src/data/comprehensive_database.json"]
+
+# Purpose groups and the scraped categories that feed them
+PURPOSES = {
+    'ui_ux_design': ("Tools for user interface and user experience design", ['design-tools', 'ux-tools']),
+    'ai_powered_design': ("AI-enhanced tools for automated and intelligent design", ['ai-tools']),
+    'web_development': ("Tools for building websites without coding", ['web-builder']),
+    'visual_assets': ("Tools and resources for visual content creation",
+                      ['icons', 'illustrations', 'mockups', 'stock-photos']),
+    'color_typography': ("Tools for color palettes and typography", ['color-tools', 'typography']),
+    'user_research': ("Tools for user testing and research", ['ux-tools', 'accessibility']),
+    'design_inspiration': ("Platforms for design inspiration and showcases", ['inspiration']),
+    'learning_resources': ("Courses, books, blogs and podcasts for designers",
+                           ['learning', 'books', 'blogs', 'podcasts']),
+    'collaboration': ("Communities and tools for working with other people", ['community', 'project-tools']),
+}
+
+PRICING_KEYS = {
+    'FREE': 'free',
+    'FREEMIUM': 'freemium',
+    'PAID': 'paid',
+    'FREE + PAID': 'free_plus_paid',
+    'WITH ATTRIBUTION': 'with_attribution',
+}
+
+PRICING_DESCRIPTIONS = {
+    'free': "Completely free tools",
+    'freemium': "Free with paid upgrades",
+    'paid': "Paid tools and subscriptions",
+    'free_plus_paid': "Free tier alongside paid products",
+    'with_attribution': "Free to use with attribution",
+}
+
+PRICING_EXAMPLES = 5
+
+
+def build_views(database):
+    """Walk every tool once and return (tools_index, comprehensive_database)"""
+    return views_from_categories(database['categories'].items(), database['meta'])
+
+
+def views_from_categories(categories, meta):
+    """build_views() over a stream of (category_key, category) pairs.
+
+    Per-category and per-purpose lists include tools collapsed into another
+    category; totals and pricing lists count each tool once.
+    """
+    purposes_by_category = {}
+    for purpose, (_, category_keys) in PURPOSES.items():
+        for category_key in category_keys:
+            purposes_by_category.setdefault(category_key, []).append(purpose)
+
+    tools_by_purpose = {purpose: {'description': description, 'tools': []}
+                        for purpose, (description, _) in PURPOSES.items()}
+    tools_by_pricing = {key: [] for key in PRICING_KEYS.values()}
+    tools_by_category_count = {}
+    summary_categories = {}
+    total_tools = 0
+
+    # A tool in two categories of the same purpose is listed there once. Only
+    # collapsed tools can repeat; they are kept referenced so their ids stay
+    # unique while categories stream past.
+    purpose_members = {purpose: {} for purpose in PURPOSES}
+
+    for category_key, category, own in expand_memberships(categories):
+        purposes = purposes_by_category.get(category_key, [])
+        summaries = []
+        for position, tool in enumerate(category['tools']):
+            # Tools past the category's own ones are stored under another category
+            if position < own:
+                total_tools += 1
+                pricing_key = PRICING_KEYS.get(tool.get('pricing'), 'free')
+                tools_by_pricing[pricing_key].append(tool['name'])
+            for purpose in purposes:
+                if tool.get('categories'):
+                    if id(tool) in purpose_members[purpose]:
+                        continue
+                    purpose_members[purpose][id(tool)] = tool
+                tools_by_purpose[purpose]['tools'].append({
+                    'name': tool['name'],
+                    'category': category['name'],
+                    'pricing': tool.get('pricing'),
+                    'primary_use': tool.get('description', ''),
+                })
+            summaries.append({
+                'name': tool['name'],
+                'url': tool.get('url', ''),
+                'pricing': tool.get('pricing'),
+                'description': tool.get('description', ''),
+            })
+        tools_by_category_count[category_key] = len(summaries)
+        summary_categories[category_key] = {'tools': summaries}
+
+    tools_index = {
+        'meta': {
+            'source': DATABASE_FILE,
+            'created_date': meta.get('created_date'),
+            'total_tools': total_tools,
+        },
+        'tools_by_purpose': tools_by_purpose,
+        'tools_by_pricing': tools_by_pricing,
+        'tools_by_category_count': tools_by_category_count,
+    }
+
+    comprehensive = {
+        'comprehensive_tools_database': {
+            'meta': {
+                'source': meta.get('source'),
+                'scraped_date': meta.get('created_date'),
+                'total_categories': len(summary_categories),
+                'total_tools': total_tools,
+                'description': "Complete database of design tools from toools.design",
+            },
+            'categories': summary_categories,
+            'pricing_categories': {
+                key: {
+                    'description': PRICING_DESCRIPTIONS[key],
+                    'count': len(names),
+                    'examples': names[:PRICING_EXAMPLES],
+                }
+                for key, names in tools_by_pricing.items()
+            },
+        }
+    }
+
+    return tools_index, comprehensive
+
+
+def write_derived_views(database):
+    """Regenerate both derived views from database, writing only files that changed"""
+    return write_views(*build_views(database))
+
+
+def write_views(tools_index, comprehensive):
+    """Write built views, only the files that changed"""
+    written = write_targets(serialize(tools_index), TOOLS_INDEX_TARGETS)
+    written += write_targets(serialize(comprehensive), COMPREHENSIVE_TARGETS)
+    for path in TOOLS_INDEX_TARGETS + COMPREHENSIVE_TARGETS:
+        print(f"{'Updated' if path in written else 'Unchanged'}: {path}")
+    return written
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Regenerate tools_index.json and comprehensive_database.json")
+    parser.add_argument("--database", default=DATABASE_FILE, help="Database JSON to derive the views from")
+    args = parser.parse_args()
+
+    with open(args.database, 'r', encoding='utf-8') as f:
+        write_derived_views(json.load(f))
@@ -0,0 +1,248 @@
+#!/usr/bin/env python3
+"""
+Category discovery from the site's sitemap and navigation.
+
+Instead of only crawling the hard-coded category URLs, discover_categories()
+reads sitemap.xml (following sitemap indexes) and the links on the home page
+into a Frontier: one entry per normalized URL with its lastmod, the category
+it was mapped to and what the last crawl found there. A URL whose lastmod has
+not moved since it was last fetched does not need fetching again, and pages
+that turned out not to list any tools are remembered so they are not
+re-crawled either until the sitemap says they changed.
+"""
+
+import json
+import os
+import re
+import xml.etree.ElementTree as ElementTree
+from datetime import date
+from urllib.parse import urljoin, urlsplit
+
+from bs4 import BeautifulSoup, SoupStrainer
+
+from instrumentation import DETAIL, QUIET, count, log
+from link_classifier import SKIP_NAMES
+
+FRONTIER_FILE = ".cache/frontier.json"
+SITEMAP_PATH = "/sitemap.xml"
+SITEMAP_NS = "{http://www.sitemaps.org/schemas/sitemap/0.9}"
+
+# Sitemap indexes can nest; more than this is not a site this size
+MAX_SITEMAPS = 20
+
+# Top-level pages that are never tool listings, including the nav entries
+# the category page parser skips
+IGNORED_SLUGS = frozenset([
+    'about', 'contact', 'privacy', 'privacy-policy', 'terms', 'terms-of-service',
+    'submit', 'submit-a-tool', 'newsletter', 'search', 'sitemap', '404', '401',
+]) | SKIP_NAMES
+
+SLUG = re.compile(r'^[a-z0-9][a-z0-9-]*$')
+
+
+def normalize_url(url):
+    """Frontier key of a page: lower-case host, no query, fragment or trailing slash"""
+    parts = urlsplit(url.strip())
+    return f"{parts.scheme.lower()}://{parts.netloc.lower()}{parts.path.rstrip('/')}"
+
+
+def page_slug(url, base_url):
+    """The slug of a top-level page on the site, or None for anything else"""
+    parts = urlsplit(url)
+    if parts.netloc.lower() != urlsplit(base_url).netloc.lower():
+        return None
+    slug = parts.path.strip('/').lower()
+    if not SLUG.match(slug) or slug in IGNORED_SLUGS:
+        return None
+    return slug
+
+
+def parse_sitemap(body):
+    """Return ([(url, lastmod)], [child sitemap urls]) from a sitemap or sitemap index"""
+    try:
+        root = ElementTree.fromstring(body)
+    except ElementTree.ParseError:
+        return [], []
+    pages, sitemaps = [], []
+    for element in root:
+        loc = (element.findtext(f'{SITEMAP_NS}loc') or '').strip()
+        if not loc:
+            continue
+        if element.tag == f'{SITEMAP_NS}sitemap':
+            sitemaps.append(loc)
+        elif element.tag == f'{SITEMAP_NS}url':
+            lastmod = element.findtext(f'{SITEMAP_NS}lastmod')
+            pages.append((loc, lastmod.strip() if lastmod else None))
+    return pages, sitemaps
+
+
+def read_sitemap(base_url, fetch_body):
+    """Every (url, lastmod) listed by the site's sitemap, or [] if it has none"""
+    queue = [urljoin(base_url, SITEMAP_PATH)]
+    seen = set()
+    pages = []
+    while queue and len(seen) < MAX_SITEMAPS:
+        url = queue.pop(0)
+        if url in seen:
+            continue
+        seen.add(url)
+        body = fetch_body(url)
+        if body is None:
+            continue
+        found, children = parse_sitemap(body)
+        pages += found
+        queue += children
+    count('sitemaps_read', len(seen))
+    return pages
+
+
+def nav_links(html, base_url):
+    """(url, text) of the links in the page's <nav> and <header>, or of all links if it has neither"""
+    soup = BeautifulSoup(html, 'html.parser', parse_only=SoupStrainer(['nav', 'header']))
+    links = soup.find_all('a', href=True)
+    if not links:
+        links = BeautifulSoup(html, 'html.parser', parse_only=SoupStrainer('a', href=True)).find_all('a')
+    return [(urljoin(base_url, link['href']), link.get_text(' ', strip=True)) for link in links]
+
+
+class Frontier:
+    """Discovered page URLs with their per-URL crawl state.
+
+    Each entry records the sitemap lastmod and nav text seen by the latest
+    discovery, the category the URL was mapped to, and from its last fetch
+    the lastmod at that time, the tools found and a status: 'category',
+    'empty' (no tools) or 'gone' (no longer listed anywhere).
+    """
+
+    def __init__(self, path=FRONTIER_FILE):
+        self.path = path
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                self.urls = json.load(f)
+        except (OSError, ValueError):
+            self.urls = {}
+        self._seen = set()
+
+    def add(self, url, lastmod=None, name=None):
+        """Record a sighting of url; duplicates from the sitemap and nav merge into one entry"""
+        key = normalize_url(url)
+        entry = self.urls.setdefault(key, {'first_seen': date.today().isoformat()})
+        if key not in self._seen:
+            # Forget the previous discovery's view of the page before merging this one's
+            entry.pop('lastmod', None)
+            entry.pop('name', None)
+            if entry.get('status') == 'gone':
+                del entry['status']
+        self._seen.add(key)
+        if lastmod:
+            entry['lastmod'] = lastmod
+        if name and not entry.get('name'):
+            entry['name'] = name
+        return key
+
+    def seen(self):
+        """URLs found by this run's discovery, in the order they were found"""
+        return [url for url in self.urls if url in self._seen]
+
+    def needs_fetch(self, url):
+        """False only when the sitemap lastmod is unchanged since the URL was last fetched"""
+        entry = self.urls.get(normalize_url(url), {})
+        return not entry.get('lastmod') or entry['lastmod'] != entry.get('fetched_lastmod')
+
+    def fetched(self, url, category, tools=None):
+        """Record that url was fetched for category (and parsed into tools tools, when known)"""
+        entry = self.urls.setdefault(normalize_url(url), {'first_seen': date.today().isoformat()})
+        entry.update(category=category, fetched_lastmod=entry.get('lastmod'), fetched=date.today().isoformat())
+        if tools is not None:
+            entry.update(tools=tools, status='category' if tools else 'empty')
+        else:
+            entry.setdefault('status', 'category')
+
+    def retire_unseen(self):
+        """Mark URLs that discovery no longer finds as gone and return them"""
+        gone = [url for url, entry in self.urls.items()
+                if url not in self._seen and entry.get('status') != 'gone']
+        for url in gone:
+            self.urls[url]['status'] = 'gone'
+        return gone
+
+    def save(self):
+        os.makedirs(os.path.dirname(self.path) or '.', exist_ok=True)
+        tmp_path = self.path + '.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(self.urls, f, indent=2, ensure_ascii=False)
+        os.replace(tmp_path, self.path)
+
+
+def discover_categories(base_url, fetch_body, frontier, known):
+    """Build the category definitions to crawl from the sitemap and the home page nav.
+
+    known is the hard-coded definitions (get_categories()): a discovered URL
+    keeps the key, name and description of the known category at the same
+    path, or with the same name as its nav link (a renamed slug). Other URLs
+    become new categories keyed by their slug only when the home page nav
+    links to them, and not when a previous crawl found them empty and their
+    lastmod has not changed; pages only in the sitemap are reported for
+    review instead of being published. Known categories that were not
+    discovered are reported and left out rather than crawled into empty ones.
+
+    fetch_body(url) returns the body or None. Returns the definitions in the
+    shape of get_categories(), each URL with its frontier key.
+    """
+    for url, lastmod in read_sitemap(base_url, fetch_body):
+        if page_slug(url, base_url):
+            frontier.add(url, lastmod=lastmod)
+
+    home = fetch_body(base_url.rstrip('/') + '/')
+    if home is not None:
+        for url, text in nav_links(home, base_url):
+            if page_slug(url, base_url):
+                frontier.add(url, name=text)
+
+    discovered = frontier.seen()
+    if not discovered:
+        log(f"Discovery found no pages under {base_url}; using the built-in category list", QUIET)
+        return known
+
+    by_path = {urlsplit(url).path.strip('/').lower(): key
+               for key, info in known.items() for url in info['urls']}
+    by_name = {info['name'].lower(): key for key, info in known.items()}
+
+    categories = {}
+    unlisted = []
+    for url in discovered:
+        entry = frontier.urls[url]
+        slug = urlsplit(url).path.strip('/')
+        key = by_path.get(slug) or by_name.get((entry.get('name') or '').lower())
+        if key is None:
+            if not entry.get('name'):
+                unlisted.append(url)
+                continue
+            if entry.get('status') == 'empty' and not frontier.needs_fetch(url):
+                continue
+            key = entry.get('category') or slug
+        if key in categories:
+            if url not in categories[key]['urls']:
+                categories[key]['urls'].append(url)
+            continue
+        info = known.get(key) or {'name': entry['name'], 'description': ''}
+        categories[key] = {**info, 'urls': [url]}
+        if key not in known:
+            count('categories_discovered')
+            log(f"Discovered {url} as new category {key}", DETAIL)
+
+    # Known categories first, in their usual order, then new ones as found
+    ordered = {key: categories.pop(key) for key in known if key in categories}
+    ordered.update(categories)
+
+    if unlisted:
+        count('pages_for_review', len(unlisted))
+        log(f"Not linked from the nav, left for review: {', '.join(unlisted)}", QUIET)
+    missing = [key for key in known if key not in ordered]
+    if missing:
+        log(f"Not found by discovery, skipped: {', '.join(missing)}", QUIET)
+    gone = frontier.retire_unseen()
+    if gone:
+        log(f"No longer listed: {', '.join(gone)}", QUIET)
+    log(f"Discovered {len(discovered)} pages: {len(ordered)} categories to crawl")
+    return ordered
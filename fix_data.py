@@ -1,167 +1,231 @@
 #!/usr/bin/env python3
 """
-Manual data cleanup and enhancement for key tools
+Manual data cleanup and enhancement for key tools.
+
+Curated overrides live in data/tool_overrides.json, keyed by category. Each
+override replaces the scraped tool it matches or is added to the category.
+Matching uses indexes built once per category: exact normalized name first,
+then canonical URL, then (as an explicit, reported fallback) a unique
+name-prefix match on the override's site, for scraped names that ran into
+their description.
 """
 
+import argparse
 import json
 import re
+from bisect import bisect_left
+from urllib.parse import urlparse
 
-def fix_tool_data():
-    """Fix and enhance the scraped tool data"""
+from db_stream import iter_categories, write_derived_stream, write_stream
+from db_writer import DATABASE_TARGETS, write_database
+from instrumentation import DETAIL, QUIET, add_arguments, count, instrumented, log, timer
+from search_index import write_index
+
+DATABASE_FILE = DATABASE_TARGETS[0]
+OVERRIDES_FILE = "data/tool_overrides.json"
+
+NON_ALNUM = re.compile(r'[^0-9a-z]+')
+
+def normalize_name(name):
+    """Case- and punctuation-insensitive key for a tool name"""
+    return NON_ALNUM.sub('', name.lower())
+
+def url_host(url):
+    """Host without www., or None"""
+    host = urlparse(url or '').netloc.lower()
+    if host.startswith('www.'):
+        host = host[4:]
+    return host or None
+
+def url_key(url):
+    """Host without www. plus path without trailing slash, for matching the same site"""
+    host = url_host(url)
+    if not host:
+        return None
+    return host + urlparse(url).path.rstrip('/')
+
+class CategoryIndex:
+    """Name and URL lookups over one category's tools, built once"""
     
-    # Load the current database
-    with open('public/design_tools_database.json', 'r', encoding='utf-8') as f:
-        database = json.load(f)
-    
-    # Manual fixes for important tools
-    fixes = {
-        'icons': [
-            {
-                'name': 'Material Symbols',
-                'description': 'Over 2,500 glyphs in a single font file with a wide range of design variants.',
-                'image': 'https://cdn.prod.website-files.com/5ce10a4d0b5f0b560c22e756/6267b6660e723375d445ead5_material-symbols.svg',
-                'url': 'https://fonts.google.com/icons',
-                'pricing': 'FREE',
-                'use_cases': ['Google Icons', 'Material Design', 'System Icons']
-            },
-            {
-                'name': 'Heroicons',
-                'description': 'Beautiful hand-crafted SVG icons.',
-                'image': 'https://heroicons.com/favicon.ico',
-                'url': 'https://heroicons.com/',
-                'pricing': 'FREE',
-                'use_cases': ['Hand-crafted', 'SVG Icons', 'Web Development']
-            },
-            {
-                'name': 'Lucide',
-                'description': 'Beautiful & consistent icon toolkit made by the community.',
-                'image': 'https://lucide.dev/favicon.ico',
-                'url': 'https://lucide.dev/',
-                'pricing': 'FREE',
-                'use_cases': ['Community Made', 'Consistent Design', 'Open Source']
-            },
-            {
-                'name': 'Streamline',
-                'description': 'All the icons you need, in every style you love.',
-                'image': 'https://streamlinehq.com/favicon.ico',
-                'url': 'https://home.streamlinehq.com/',
-                'pricing': 'FREEMIUM',
-                'use_cases': ['Largest Collection', 'Multiple Styles', 'Professional']
-            },
-            {
-                'name': 'Feather',
-                'description': 'Simply beautiful open source icons.',
-                'image': 'https://feathericons.com/favicon.ico',
-                'url': 'https://feathericons.com/',
-                'pricing': 'FREE',
-                'use_cases': ['Open Source', 'Minimalist', 'Beautiful']
-            },
-            {
-                'name': 'Phosphor Icons',
-                'description': 'A flexible icon family for everyone.',
-                'image': 'https://phosphoricons.com/favicon.ico',
-                'url': 'https://phosphoricons.com/',
-                'pricing': 'FREE',
-                'use_cases': ['Flexible', 'Family', 'Multi-weight']
-            }
-        ],
-        'illustrations': [
-            {
-                'name': 'unDraw',
-                'description': 'Lots of free illustrations that match with your brand colors on the fly.',
-                'image': 'https://undraw.co/favicon.ico',
-                'url': 'https://undraw.co/',
-                'pricing': 'FREE',
-                'use_cases': ['Brand Colors', 'SVG Illustrations', 'Open Source']
-            },
-            {
-                'name': 'Humaaans',
-                'description': 'Mix-&-match illustrations of people with a design library.',
-                'image': 'https://www.humaaans.com/favicon.ico',
-                'url': 'https://www.humaaans.com/',
-                'pricing': 'FREE',
-                'use_cases': ['People Illustrations', 'Character Design', 'Customizable']
-            },
-            {
-                'name': 'Storyset',
-                'description': 'Awesome free customizable illustrations for your next project.',
-                'image': 'https://storyset.com/favicon.ico',
-                'url': 'https://storyset.com/',
-                'pricing': 'FREE',
-                'use_cases': ['Animated Illustrations', 'Customizable', 'Story Themes']
-            }
-        ],
-        'mockups': [
-            {
-                'name': 'Rotato',
-                'description': 'Mac app that lets you create, capture, and animate 3D mockups for your digital designs in seconds.',
-                'image': 'https://rotato.app/favicon.ico',
-                'url': 'https://rotato.app/',
-                'pricing': 'PAID',
-                'use_cases': ['3D Mockups', 'Mac App', 'Animation']
-            },
-            {
-                'name': 'Mockuuups Studio',
-                'description': 'Drag-and-drop tool for creating beautiful app and website mockups.',
-                'image': 'https://mockuuups.studio/favicon.ico',
-                'url': 'https://mockuuups.studio/',
-                'pricing': 'FREEMIUM',
-                'use_cases': ['Drag & Drop', 'App Mockups', 'Website Mockups']
-            }
-        ]
-    }
-    
-    # Apply fixes
-    for category_key, fixed_tools in fixes.items():
-        if category_key in database['categories']:
-            # Keep existing tools but replace the first few with our fixed versions
-            existing_tools = database['categories'][category_key]['tools']
-            
-            # Replace tools with matching names or add new ones
-            for fixed_tool in fixed_tools:
-                # Find if this tool already exists
-                found = False
-                for i, existing_tool in enumerate(existing_tools):
-                    if (fixed_tool['name'].lower() in existing_tool['name'].lower() or 
-                        existing_tool['name'].lower() in fixed_tool['name'].lower()):
-                        existing_tools[i] = fixed_tool
-                        found = True
-                        break
-                
-                if not found:
-                    # Add to the beginning of the list
-                    existing_tools.insert(0, fixed_tool)
-            
-            # Remove duplicates
-            seen_names = set()
-            unique_tools = []
-            for tool in existing_tools:
-                name_lower = tool['name'].lower()
-                if name_lower not in seen_names:
-                    unique_tools.append(tool)
-                    seen_names.add(name_lower)
+    def __init__(self, tools):
+        self.by_name = {}
+        self.by_url = {}
+        self.hosts = [url_host(tool.get('url')) for tool in tools]
+        for i, tool in enumerate(tools):
+            self.by_name.setdefault(normalize_name(tool['name']), i)
+            key = url_key(tool.get('url'))
+            if key:
+                self.by_url.setdefault(key, i)
+        self.sorted_names = sorted(self.by_name)
+    
+    def prefix_matches(self, prefix):
+        """Positions of tools whose normalized name starts with prefix"""
+        matches = []
+        for i in range(bisect_left(self.sorted_names, prefix), len(self.sorted_names)):
+            name = self.sorted_names[i]
+            if not name.startswith(prefix):
+                break
+            matches.append(self.by_name[name])
+        return matches
+    
+    def match(self, override, fuzzy=True):
+        """Return (position, how) for the tool an override replaces, or (None, reason)"""
+        name = normalize_name(override['name'])
+        if name in self.by_name:
+            return self.by_name[name], 'name'
+        key = url_key(override.get('url'))
+        if key and key in self.by_url:
+            return self.by_url[key], 'url'
+        if fuzzy and name:
+            candidates = self.prefix_matches(name)
+            # A lone prefix match is only trusted when it is on the override's site
+            host = url_host(override.get('url'))
+            if len(candidates) == 1 and host and self.hosts[candidates[0]] == host:
+                return candidates[0], 'fuzzy'
+            if candidates:
+                return None, 'ambiguous'
+        return None, 'new'
+
+def merge_overrides(tools, overrides, fuzzy=True):
+    """Apply overrides to a category's tools, returning (tools, report).
+    
+    Replacements keep the matched tool's position and any fields the
+    override does not set (such as dedupe's 'categories'); unmatched
+    overrides are added to the front in the order they are listed. Prefix
+    matches that are not unique, or not on the override's site, are left
+    unapplied and reported as ambiguous.
+    """
+    index = CategoryIndex(tools)
+    merged = list(tools)
+    added = []
+    report = {'name': [], 'url': [], 'fuzzy': [], 'new': [], 'ambiguous': []}
+    claimed = set()
+    
+    for override in overrides:
+        position, how = index.match(override, fuzzy)
+        if position is not None and position in claimed:
+            position, how = None, 'new'
+        if position is not None:
+            report[how].append(f"{merged[position]['name']} -> {override['name']}")
+            merged[position] = {**merged[position], **override}
+            claimed.add(position)
+        elif how == 'ambiguous':
+            report['ambiguous'].append(override['name'])
+        else:
+            report['new'].append(override['name'])
+            added.append(dict(override))
+    
+    # Remove duplicates
+    seen_names = set()
+    unique_tools = []
+    for tool in added + merged:
+        name_lower = tool['name'].lower()
+        if name_lower not in seen_names:
+            unique_tools.append(tool)
+            seen_names.add(name_lower)
+    
+    return unique_tools, report
+
+def load_overrides(path=OVERRIDES_FILE):
+    """Curated tool overrides keyed by category"""
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+def apply_category_overrides(category_key, tools, fixed_tools, fuzzy=True):
+    """Merge one category's overrides and print what matched how"""
+    tools, report = merge_overrides(tools, fixed_tools, fuzzy)
+    
+    log(f"{category_key}: {len(report['name'])} by name, {len(report['url'])} by URL, "
+        f"{len(report['fuzzy'])} fuzzy, {len(report['new'])} added, "
+        f"{len(report['ambiguous'])} ambiguous")
+    for how, entries in report.items():
+        count(f"overrides_{how}", len(entries))
+    for how in ('fuzzy', 'ambiguous'):
+        for entry in report[how]:
+            log(f"  {how}: {entry}", DETAIL)
+    return tools
+
+def override_stage(categories, fixes, fuzzy=True):
+    """Stage applying the overrides for each category as it streams past"""
+    for category_key, category in categories:
+        if category_key in fixes:
+            tools = apply_category_overrides(category_key, category['tools'], fixes[category_key], fuzzy)
+            category = {**category, 'tools': tools}
+        yield category_key, category
+
+def apply_overrides(database, fixes, fuzzy=True):
+    """Apply overrides keyed by category to a loaded database in place"""
+    with timer('transform'):
+        for category_key, fixed_tools in fixes.items():
+            if category_key not in database['categories']:
+                log(f"Skipping overrides for unknown category: {category_key}", QUIET)
+                continue
             
-            database['categories'][category_key]['tools'] = unique_tools
+            category = database['categories'][category_key]
+            category['tools'] = apply_category_overrides(category_key, category['tools'], fixed_tools, fuzzy)
     
     # Update meta information
     total_tools = sum(len(cat['tools']) for cat in database['categories'].values())
     database['meta']['total_tools'] = total_tools
+    return database
+
+def fix_tool_data(overrides_file=OVERRIDES_FILE, fuzzy=True):
+    """Fix and enhance the scraped tool data"""
     
-    # Save the updated database to all locations
-    with open('public/design_tools_database.json', 'w', encoding='utf-8') as f:
-        json.dump(database, f, indent=2, ensure_ascii=False)
+    # Load the current database
+    with timer('load'):
+        with open(DATABASE_FILE, 'r', encoding='utf-8') as f:
+            database = json.load(f)
     
-    with open('data/design_tools_database.json', 'w', encoding='utf-8') as f:
-        json.dump(database, f, indent=2, ensure_ascii=False)
+    fixes = load_overrides(overrides_file)
+    apply_overrides(database, fixes, fuzzy)
+    total_tools = database['meta']['total_tools']
     
-    # Also update the src/data version used for SSR
-    with open('src/data/design_tools_database.json', 'w', encoding='utf-8') as f:
-        json.dump(database, f, indent=2, ensure_ascii=False)
+    # Save the updated database to all locations (data, public and src/data for SSR)
+    write_database(database)
+    write_index(database)
     
     print(f"Database updated with {total_tools} total tools")
     print(f"Key tools enhanced in {len(fixes)} categories")
     
     return database
 
+def fix_tool_data_stream(overrides_file=OVERRIDES_FILE, fuzzy=True):
+    """Apply the overrides one category at a time, without loading the whole database.
+    
+    Writes every database copy and the category shards as the categories
+    stream past, then rebuilds the search index and derived views from the
+    written file in further streaming passes. Those cover every tool, so
+    peak memory still grows with the total tool count.
+    """
+    fixes = load_overrides(overrides_file)
+    seen = set()
+    
+    def categories():
+        for category_key, category in iter_categories(DATABASE_FILE, head):
+            seen.add(category_key)
+            yield category_key, category
+    
+    head = {}
+    written, total_tools = write_stream(override_stage(categories(), fixes, fuzzy), head)
+    for category_key in fixes:
+        if category_key not in seen:
+            log(f"Skipping overrides for unknown category: {category_key}", QUIET)
+    for path in DATABASE_TARGETS:
+        print(f"{'Updated' if path in written else 'Unchanged'}: {path}")
+    write_derived_stream()
+    print(f"Database updated with {total_tools} total tools")
+
 if __name__ == "__main__":
-    fix_tool_data()
+    parser = argparse.ArgumentParser(description="Apply curated tool overrides to the database")
+    parser.add_argument("--overrides", default=OVERRIDES_FILE, help="JSON file of overrides keyed by category")
+    parser.add_argument("--no-fuzzy", action="store_true", help="Only match overrides by exact name or URL")
+    parser.add_argument("--stream", action="store_true",
+                        help="Process one category at a time instead of loading the whole database")
+    add_arguments(parser)
+    args = parser.parse_args()
+    
+    if args.stream:
+        instrumented(args, "fix_data", fix_tool_data_stream, args.overrides, fuzzy=not args.no_fuzzy)
+    else:
+        instrumented(args, "fix_data", fix_tool_data, args.overrides, fuzzy=not args.no_fuzzy)
@@ -3,10 +3,20 @@
 Fix missing images in the design tools database using Google's favicon service
 """
 
+import argparse
 import json
-import re
 from urllib.parse import urlparse
 
+from db_stream import iter_categories, map_tools, write_derived_stream, write_stream
+from db_writer import DATABASE_TARGETS, write_database
+from derived_views import write_derived_views
+from icon_mirror import is_mirrored, mirror_icons
+from image_check import CHECK_CACHE_FILE, CHECK_TTL, PLACEHOLDER_IMAGE, ImageCheckCache, verify_images
+from instrumentation import DETAIL, add_arguments, count, instrumented, log, timer
+from search_index import write_index
+
+DATABASE_FILE = DATABASE_TARGETS[0]
+
 def extract_domain(url):
     """Extract domain from URL"""
     try:
@@ -22,58 +32,122 @@ def generate_favicon_url(domain, size=180):
     """Generate Google favicon URL for a domain"""
     return f"https://www.google.com/s2/favicons?domain={domain}&sz=180"
 
-def fix_images():
-    """Fix missing images in the database"""
+def fix_tool_image(tool):
+    """Point a tool with a missing or unusable image at its favicon.
+
+    Returns 'fixed', 'placeholder' or None when the image was left alone.
+    """
+    # Check if image is missing, empty, or just a domain favicon
+    needs_fix = False
     
-    # Load the current database
-    with open('src/data/design_tools_database.json', 'r', encoding='utf-8') as f:
-        database = json.load(f)
+    if is_mirrored(tool.get('image')) or tool.get('image') == PLACEHOLDER_IMAGE:
+        return None
+    if not tool.get('image'):
+        needs_fix = True
+    elif tool['image'] == 'N/A' or tool['image'] == '':
+        needs_fix = True
+    elif tool['image'].endswith('/favicon.ico') and 'google.com/s2/favicons' not in tool['image']:
+        needs_fix = True
+    elif not tool['image'].startswith('http'):
+        needs_fix = True
     
+    if not needs_fix:
+        return None
+    domain = extract_domain(tool.get('url', ''))
+    if domain:
+        tool['image'] = generate_favicon_url(domain)
+        log(f"Fixed image for {tool['name']}: {tool['image']}", DETAIL)
+        count('images_fixed')
+        return 'fixed'
+    # Use placeholder if we can't extract domain
+    tool['image'] = PLACEHOLDER_IMAGE
+    log(f"Used placeholder for {tool['name']} (no valid domain)", DETAIL)
+    count('images_placeholder')
+    return 'placeholder'
+
+def fix_database_images(database, verify=False, mirror=False, workers=8, requests_per_second=10.0,
+                        check_cache=None):
+    """Fix missing images in a loaded database in place, optionally verifying and mirroring them"""
     fixed_count = 0
     total_tools = 0
     
     # Process each category
-    for category_key, category in database['categories'].items():
-        for tool in category['tools']:
-            total_tools += 1
-            
-            # Check if image is missing, empty, or just a domain favicon
-            needs_fix = False
-            
-            if not tool.get('image'):
-                needs_fix = True
-            elif tool['image'] == 'N/A' or tool['image'] == '':
-                needs_fix = True
-            elif tool['image'].endswith('/favicon.ico') and 'google.com/s2/favicons' not in tool['image']:
-                needs_fix = True
-            elif not tool['image'].startswith('http'):
-                needs_fix = True
-            
-            if needs_fix:
-                domain = extract_domain(tool.get('url', ''))
-                if domain:
-                    tool['image'] = generate_favicon_url(domain)
+    with timer('transform'):
+        for category_key, category in database['categories'].items():
+            for tool in category['tools']:
+                total_tools += 1
+                if fix_tool_image(tool) == 'fixed':
                     fixed_count += 1
-                    print(f"Fixed image for {tool['name']}: {tool['image']}")
-                else:
-                    # Use placeholder if we can't extract domain
-                    tool['image'] = '/placeholder-icon.svg'
-                    print(f"Used placeholder for {tool['name']} (no valid domain)")
     
-    # Save the updated database to all locations
-    with open('src/data/design_tools_database.json', 'w', encoding='utf-8') as f:
-        json.dump(database, f, indent=2, ensure_ascii=False)
+    print(f"\nFixed {fixed_count} images out of {total_tools} total tools")
+    if verify:
+        verify_images(database, workers=workers, requests_per_second=requests_per_second, cache=check_cache)
+    if mirror:
+        mirror_icons(database, workers=workers, requests_per_second=requests_per_second)
+    return database
+
+def fix_images(verify=False, mirror=False, workers=8, requests_per_second=10.0, check_cache=None):
+    """Fix missing images in the database, optionally verifying and mirroring every image URL"""
     
-    with open('public/design_tools_database.json', 'w', encoding='utf-8') as f:
-        json.dump(database, f, indent=2, ensure_ascii=False)
+    # Load the current database
+    with timer('load'):
+        with open(DATABASE_FILE, 'r', encoding='utf-8') as f:
+            database = json.load(f)
     
-    with open('data/design_tools_database.json', 'w', encoding='utf-8') as f:
-        json.dump(database, f, indent=2, ensure_ascii=False)
+    fix_database_images(database, verify=verify, mirror=mirror, workers=workers,
+                        requests_per_second=requests_per_second, check_cache=check_cache)
     
-    print(f"\nFixed {fixed_count} images out of {total_tools} total tools")
-    print("Updated all database files (src/data, public, data)")
+    # Save the updated database to all locations
+    write_database(database)
+    write_index(database)
+    write_derived_views(database)
     
     return database
 
+def fix_images_stream():
+    """Fix missing images one category at a time, without loading the whole database.
+    
+    Writes every database copy and the category shards as the categories
+    stream past, then rebuilds the search index and derived views from the
+    written file in further streaming passes. Those cover every tool, so
+    peak memory still grows with the total tool count.
+    """
+    counts = {'fixed': 0}
+    
+    def fix(tool, category_key):
+        result = fix_tool_image(tool)
+        if result:
+            counts[result] = counts.get(result, 0) + 1
+        return tool
+    
+    head = {}
+    categories = map_tools(iter_categories(DATABASE_FILE, head), fix)
+    written, total_tools = write_stream(categories, head)
+    print(f"\nFixed {counts['fixed']} images out of {total_tools} total tools")
+    for path in DATABASE_TARGETS:
+        print(f"{'Updated' if path in written else 'Unchanged'}: {path}")
+    write_derived_stream()
+
 if __name__ == "__main__":
-    fix_images()
+    parser = argparse.ArgumentParser(description="Fix missing tool images")
+    parser.add_argument("--verify", action="store_true",
+                        help="Request every image URL and use the placeholder for broken ones")
+    parser.add_argument("--mirror", action="store_true",
+                        help="Download icons into public/icons and point tools at the local copies")
+    parser.add_argument("--workers", type=int, default=8, help="Concurrent image checks and downloads")
+    parser.add_argument("--rate", type=float, default=10.0, help="Max requests per second per host (0 = unlimited)")
+    parser.add_argument("--check-cache", default=CHECK_CACHE_FILE, help="Image check result cache")
+    parser.add_argument("--check-ttl", type=int, default=CHECK_TTL, help="Seconds a cached check result is trusted")
+    parser.add_argument("--stream", action="store_true",
+                        help="Process one category at a time instead of loading the whole database")
+    add_arguments(parser)
+    args = parser.parse_args()
+
+    if args.stream:
+        if args.verify or args.mirror:
+            parser.error("--verify and --mirror need the whole database and cannot be combined with --stream")
+        instrumented(args, "fix_images", fix_images_stream)
+    else:
+        instrumented(args, "fix_images", fix_images, verify=args.verify, mirror=args.mirror,
+                     workers=args.workers, requests_per_second=args.rate,
+                     check_cache=ImageCheckCache(args.check_cache, ttl=args.check_ttl))
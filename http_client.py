@@ -0,0 +1,147 @@
+#!/usr/bin/env python3
+"""
+Shared HTTP fetch layer for the scrapers: pooled keep-alive session plus
+retries with exponential backoff, jitter and Retry-After support
+"""
+
+import random
+import threading
+import time
+from email.utils import parsedate_to_datetime
+
+import requests
+from requests.adapters import HTTPAdapter
+
+DEFAULT_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
+}
+
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+
+DEFAULT_RETRIES = 3
+DEFAULT_BACKOFF = 0.5
+MAX_BACKOFF = 30.0
+DEFAULT_TIMEOUT = 20
+
+_session = None
+_session_lock = threading.Lock()
+
+
+class FetchError(Exception):
+    """Raised when a URL could not be fetched after all retries"""
+
+
+class CachedResponse:
+    """Minimal stand-in for requests.Response when the body comes from the cache"""
+
+    status_code = 200
+    from_cache = True
+
+    def __init__(self, url, content):
+        self.url = url
+        self.content = content
+        self.headers = {}
+
+    @property
+    def text(self):
+        return self.content.decode('utf-8', errors='replace')
+
+
+def get_session(pool_size=10):
+    """Return the process-wide session, creating it on first use"""
+    global _session
+    with _session_lock:
+        if _session is None:
+            session = requests.Session()
+            session.headers.update(DEFAULT_HEADERS)
+            # Retries are handled below so backoff and Retry-After stay in one place
+            adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=0)
+            session.mount('http://', adapter)
+            session.mount('https://', adapter)
+            _session = session
+        return _session
+
+
+def parse_retry_after(value):
+    """Convert a Retry-After header (seconds or HTTP date) into seconds to wait"""
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(0.0, retry_at.timestamp() - time.time())
+
+
+def backoff_delay(attempt, backoff=DEFAULT_BACKOFF, max_backoff=MAX_BACKOFF):
+    """Exponential backoff with full jitter for the given retry attempt (0-based)"""
+    return random.uniform(0, min(max_backoff, backoff * (2 ** attempt)))
+
+
+def fetch(url, retries=DEFAULT_RETRIES, backoff=DEFAULT_BACKOFF, timeout=DEFAULT_TIMEOUT,
+          headers=None, session=None, cache=None, offline=False):
+    """GET url on the shared session, retrying connection errors, 429 and 5xx.
+
+    With a ResponseCache, fresh entries are served without a request, stale
+    ones are revalidated with If-None-Match / If-Modified-Since and reused on
+    304, and offline=True never touches the network.
+
+    Returns the successful response (from_cache tells where the body came
+    from); raises FetchError once retries are exhausted, the server answers
+    with a non-retryable error status, or an offline URL is not cached.
+    """
+    entry = cache.get(url) if cache else None
+    if entry and (offline or cache.is_fresh(entry)):
+        return CachedResponse(url, cache.read_body(url))
+    if offline:
+        raise FetchError(f"{url}: not in cache (offline mode)")
+
+    if entry:
+        headers = {**(headers or {}), **cache.validators(entry)}
+
+    response = _fetch_with_retries(url, retries, backoff, timeout, headers, session or get_session())
+
+    if cache:
+        if response.status_code == 304 and entry:
+            cache.touch(url, entry)
+            return CachedResponse(url, cache.read_body(url))
+        cache.put(url, response.content,
+                  etag=response.headers.get('ETag'),
+                  last_modified=response.headers.get('Last-Modified'))
+    response.from_cache = False
+    return response
+
+
+def _fetch_with_retries(url, retries, backoff, timeout, headers, session):
+    """Issue the GET, retrying transient failures with backoff"""
+    last_error = None
+
+    for attempt in range(retries + 1):
+        retry_after = None
+        try:
+            response = session.get(url, headers=headers, timeout=timeout)
+        except (requests.ConnectionError, requests.Timeout) as e:
+            last_error = e
+        else:
+            if response.status_code not in RETRY_STATUSES:
+                try:
+                    response.raise_for_status()
+                except requests.HTTPError as e:
+                    raise FetchError(f"{url}: {e}") from e
+                return response
+            last_error = requests.HTTPError(f"HTTP {response.status_code}", response=response)
+            retry_after = parse_retry_after(response.headers.get('Retry-After'))
+
+        if attempt == retries:
+            break
+
+        delay = backoff_delay(attempt, backoff)
+        if retry_after is not None:
+            delay = min(max(delay, retry_after), MAX_BACKOFF)
+        print(f"Retrying {url} in {delay:.1f}s ({last_error})")
+        time.sleep(delay)
+
+    raise FetchError(f"{url}: giving up after {retries + 1} attempts ({last_error})")
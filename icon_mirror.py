@@ -0,0 +1,175 @@
+#!/usr/bin/env python3
+"""
+Mirror tool icons into a content-addressed local store.
+
+Every remote tool image is downloaded once, named by the sha256 of its bytes
+(so identical icons from different URLs share one file) and, when Pillow is
+installed, resized to ICON_SIZES square WebP files. The tool's image is then
+rewritten to the local path so pages load icons from the site itself. The
+source URL -> local path map is kept in data/icon_sources.json so re-runs
+skip icons that are already stored.
+"""
+
+import hashlib
+import io
+import json
+import os
+
+from crawler import HostRateLimiter, crawl
+from db_writer import serialize, write_targets
+from http_client import FetchError, fetch
+from instrumentation import DETAIL, count, log, timer
+
+try:
+    from PIL import Image
+except ImportError:
+    Image = None
+
+ICON_DIR = "public/icons"
+ICON_URL_PREFIX = "/icons/"
+SOURCES_FILE = "data/icon_sources.json"
+
+# Icons are stored at 48px and 96px: cards render them at 48px (search results
+# and featured cards scale them down to 32px) and 96px covers 2x screens. The
+# largest size is what the database points at; the 48px file shares its name
+# with the size swapped
+ICON_SIZES = (48, 96)
+WEBP_QUALITY = 90
+
+# Stored as-is when they cannot be (or need not be) rasterized
+RAW_TYPES = {
+    'image/svg+xml': 'svg',
+    'image/png': 'png',
+    'image/x-icon': 'ico',
+    'image/vnd.microsoft.icon': 'ico',
+    'image/jpeg': 'jpg',
+    'image/gif': 'gif',
+    'image/webp': 'webp',
+}
+
+
+def icon_hash(body):
+    """Content address of an icon"""
+    return hashlib.sha256(body).hexdigest()[:16]
+
+
+def icon_filename(digest, size, ext='webp'):
+    return f"{digest}-{size}.{ext}" if size else f"{digest}.{ext}"
+
+
+def is_mirrored(image):
+    return (image or '').startswith(ICON_URL_PREFIX)
+
+
+def local_path(image, directory=ICON_DIR):
+    """Filesystem path of a mirrored icon URL"""
+    return os.path.join(directory, image[len(ICON_URL_PREFIX):])
+
+
+def resize_icon(body, size):
+    """Square WebP bytes of body fitted into size x size on a transparent canvas"""
+    with Image.open(io.BytesIO(body)) as image:
+        image = image.convert('RGBA')
+        image.thumbnail((size, size), Image.LANCZOS)
+        canvas = Image.new('RGBA', (size, size), (0, 0, 0, 0))
+        canvas.paste(image, ((size - image.width) // 2, (size - image.height) // 2))
+    out = io.BytesIO()
+    canvas.save(out, 'WEBP', quality=WEBP_QUALITY, method=6)
+    return out.getvalue()
+
+
+def store_icon(body, content_type, directory=ICON_DIR):
+    """Write an icon into the store and return its local image URL.
+
+    Raster icons become one WebP per ICON_SIZES entry when Pillow is
+    available; SVGs, and everything when it is not, are stored unchanged.
+    Raises ValueError for bodies that are not images.
+    """
+    digest = icon_hash(body)
+    content_type = (content_type or '').split(';')[0].strip().lower()
+
+    if Image is not None and content_type != 'image/svg+xml':
+        names = [icon_filename(digest, size) for size in ICON_SIZES]
+        if not all(os.path.exists(os.path.join(directory, name)) for name in names):
+            try:
+                variants = [resize_icon(body, size) for size in ICON_SIZES]
+            except (OSError, ValueError) as e:
+                raise ValueError(f"not a readable image ({e})") from e
+            for name, payload in zip(names, variants):
+                write_targets(payload, [os.path.join(directory, name)])
+        return ICON_URL_PREFIX + names[-1]
+
+    ext = RAW_TYPES.get(content_type)
+    if ext is None:
+        raise ValueError(f"unexpected content type {content_type or 'none'}")
+    name = icon_filename(digest, None, ext)
+    write_targets(body, [os.path.join(directory, name)])
+    return ICON_URL_PREFIX + name
+
+
+def load_sources(path=SOURCES_FILE):
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def mirror_icons(database, directory=ICON_DIR, sources_file=SOURCES_FILE,
+                 workers=8, requests_per_second=10.0, retries=2):
+    """Download every remote tool image into the store and point tools at it.
+
+    Sources already mirrored (and still on disk) are not downloaded again;
+    icons that fail to download or decode keep their remote URL. Modifies
+    database in place and returns a report of downloaded, reused, failed and
+    stored counts.
+    """
+    if Image is None:
+        print("Pillow is not installed: icons are stored without resizing (pip install Pillow)")
+
+    sources = load_sources(sources_file)
+    limiter = HostRateLimiter(requests_per_second)
+
+    urls = sorted({tool['image'] for category in database['categories'].values()
+                   for tool in category['tools']
+                   if (tool.get('image') or '').startswith('http')})
+    pending = [(url,) for url in urls
+               if not (url in sources and os.path.exists(local_path(sources[url], directory)))]
+
+    def worker(url):
+        limiter.wait(url)
+        try:
+            with timer('icon_download'):
+                response = fetch(url, retries=retries)
+            count('bytes_downloaded', len(response.content))
+            return url, store_icon(response.content, response.headers.get('Content-Type'), directory), None
+        except (FetchError, ValueError) as e:
+            return url, None, str(e)
+
+    print(f"Mirroring {len(pending)} icons ({len(urls) - len(pending)} already stored) with {workers} workers")
+    failed = 0
+    for url, image, error in crawl(pending, worker, max_workers=workers):
+        if image:
+            sources[url] = image
+        else:
+            failed += 1
+            log(f"Could not mirror {url}: {error}", DETAIL)
+
+    for category in database['categories'].values():
+        for tool in category['tools']:
+            if tool.get('image') in sources:
+                tool['image'] = sources[tool['image']]
+
+    write_targets(serialize(dict(sorted(sources.items()))), [sources_file])
+    stored = len(set(sources.values()))
+    report = {
+        'downloaded': len(pending) - failed,
+        'reused': len(urls) - len(pending),
+        'failed': failed,
+        'stored': stored,
+    }
+    count('icons_downloaded', report['downloaded'])
+    count('icons_failed', failed)
+    print(f"Icons: {report['downloaded']} downloaded, {report['reused']} reused, "
+          f"{failed} failed; {len(sources)} sources share {stored} stored icons in {directory}")
+    return report
@@ -0,0 +1,178 @@
+#!/usr/bin/env python3
+"""
+Verify that tool image URLs resolve to an image.
+
+Every distinct remote image is requested concurrently (HEAD, falling back to a
+streamed GET when the server does not support HEAD) with bounded parallelism
+and a per-host rate limit. Results are kept in a small JSON cache with a TTL so
+repeat runs only re-check stale entries; tools whose image is definitely broken
+are pointed at the local placeholder icon, while transient failures leave the
+URL alone to be checked again.
+"""
+
+import json
+import threading
+import time
+
+import requests
+
+from crawler import HostRateLimiter, crawl
+from db_writer import serialize, write_atomic
+from http_client import DEFAULT_TIMEOUT, get_session
+from instrumentation import DETAIL, count, log, timer
+
+CHECK_CACHE_FILE = ".cache/image_checks.json"
+CHECK_TTL = 7 * 24 * 3600  # seconds a check result is trusted
+PLACEHOLDER_IMAGE = "/placeholder-icon.svg"
+
+# Favicon endpoints serve .ico files with a generic type
+IMAGE_TYPES = ('image/', 'application/octet-stream')
+SNIFF_BYTES = 1024
+
+
+class ImageCheckCache:
+    """URL-keyed check results (status, content type, size, checked_at) with a TTL"""
+
+    def __init__(self, path=CHECK_CACHE_FILE, ttl=CHECK_TTL):
+        self.path = path
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                self.entries = json.load(f)
+        except (OSError, ValueError):
+            self.entries = {}
+
+    def get(self, url):
+        """The cached result for url while it is younger than the TTL, else None"""
+        entry = self.entries.get(url)
+        if entry and time.time() - entry['checked_at'] < self.ttl:
+            return entry
+        return None
+
+    def put(self, url, entry):
+        with self._lock:
+            self.entries[url] = entry
+
+    def save(self):
+        with self._lock:
+            write_atomic(self.path, serialize(self.entries))
+
+
+def is_image(entry):
+    """True when a check result is a successful image response"""
+    status = entry.get('status')
+    content_type = (entry.get('content_type') or '').lower()
+    return status is not None and 200 <= status < 300 and content_type.startswith(IMAGE_TYPES)
+
+
+def is_broken(entry):
+    """True when a check result shows the image is gone for good.
+
+    That is a 4xx other than 429, or a successful response that is not an
+    image. Transport errors, 429, 5xx and the like may clear up and are not
+    a reason to drop the URL.
+    """
+    status = entry.get('status')
+    if status is None:
+        return False
+    if 400 <= status < 500:
+        return status != 429
+    return 200 <= status < 300 and not is_image(entry)
+
+
+def check_image(url, session=None, timeout=DEFAULT_TIMEOUT):
+    """Request url and return {status, content_type, size, checked_at}.
+
+    Transport errors give status None and an 'error' message.
+    """
+    session = session or get_session()
+    entry = {'status': None, 'content_type': None, 'size': None, 'checked_at': time.time()}
+    try:
+        response = session.head(url, timeout=timeout, allow_redirects=True)
+        if response.status_code in (403, 405, 501):
+            # Some hosts reject HEAD; read just enough of a GET to see the headers
+            with session.get(url, timeout=timeout, stream=True) as response:
+                body = next(response.iter_content(SNIFF_BYTES), b'')
+                if not response.headers.get('Content-Length'):
+                    entry['size'] = len(body)
+    except requests.RequestException as e:
+        entry['error'] = str(e)
+        return entry
+
+    entry['status'] = response.status_code
+    entry['content_type'] = response.headers.get('Content-Type', '').split(';')[0].strip() or None
+    length = response.headers.get('Content-Length')
+    if length and length.isdigit():
+        entry['size'] = int(length)
+    return entry
+
+
+def verify_images(database, workers=8, requests_per_second=10.0, cache=None):
+    """Check every remote tool image and replace broken ones with the placeholder.
+
+    Results already in the cache are reused. Only definitive results are
+    cached and acted on (see is_broken); on transient failures the tool
+    keeps its URL and it is checked again on the next run. Modifies database
+    in place and returns a report of checked, cached, ok, failed and
+    transient counts.
+    """
+    cache = cache or ImageCheckCache()
+    limiter = HostRateLimiter(requests_per_second)
+
+    urls = sorted({tool['image'] for category in database['categories'].values()
+                   for tool in category['tools']
+                   if (tool.get('image') or '').startswith('http')})
+
+    results = {}
+    pending = []
+    for url in urls:
+        entry = cache.get(url)
+        if entry:
+            results[url] = entry
+        else:
+            pending.append((url,))
+
+    def worker(url):
+        limiter.wait(url)
+        with timer('image_check'):
+            entry = check_image(url)
+        count('images_checked')
+        if is_image(entry) or is_broken(entry):
+            cache.put(url, entry)
+        return url, entry
+
+    print(f"Checking {len(pending)} images ({len(results)} cached) with {workers} workers")
+    for url, entry in crawl(pending, worker, max_workers=workers):
+        results[url] = entry
+    cache.save()
+
+    failed = transient = 0
+    for category in database['categories'].values():
+        for tool in category['tools']:
+            entry = results.get(tool.get('image'))
+            if not entry or is_image(entry):
+                continue
+            reason = entry.get('error') or f"HTTP {entry['status']} {entry.get('content_type') or ''}".strip()
+            if is_broken(entry):
+                log(f"Broken image for {tool['name']}: {tool['image']} ({reason})", DETAIL)
+                tool['image'] = PLACEHOLDER_IMAGE
+                failed += 1
+            else:
+                log(f"Could not check image for {tool['name']}, kept: {tool['image']} ({reason})", DETAIL)
+                transient += 1
+
+    report = {
+        'checked': len(pending),
+        'cached': len(urls) - len(pending),
+        'ok': sum(1 for entry in results.values() if is_image(entry)),
+        'failed_tools': failed,
+        'transient_tools': transient,
+    }
+    count('image_check_cache_hits', report['cached'])
+    count('images_broken', failed)
+    count('images_unchecked', transient)
+    print(f"Image check: {report['ok']}/{len(urls)} images ok, "
+          f"{report['checked']} checked, {report['cached']} from cache, "
+          f"{failed} tools moved to {PLACEHOLDER_IMAGE}, {transient} kept after a transient failure")
+    return report
@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+"""
+Run instrumentation for the data scripts: timers, counters, per-category
+figures and a verbosity level for progress output.
+
+Everything is recorded on one process-wide RunReport, which is safe to use
+from the crawl threads. This module only uses the standard library, so even
+db_writer can record into it. Scripts expose it through add_arguments() and
+instrumented(): --report writes the report as JSON, --profile dumps cProfile
+stats, and -v / -q raise or lower how much progress is printed.
+"""
+
+import cProfile
+import json
+import os
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime, timezone
+
+# 0: warnings and summaries, 1: per-category progress, 2: per-tool and per-page detail
+QUIET, NORMAL, DETAIL = 0, 1, 2
+
+_verbosity = NORMAL
+
+
+def set_verbosity(level):
+    global _verbosity
+    _verbosity = level
+
+
+def log(message, level=NORMAL):
+    """Print message when the verbosity is at least level"""
+    if _verbosity >= level:
+        print(message)
+
+
+class RunReport:
+    """Timers, counters and per-category figures of one run"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        with self._lock:
+            self.started = time.time()
+            self.timings = {}
+            self.counters = {}
+            self.categories = {}
+
+    @contextmanager
+    def timer(self, name):
+        """Add the wall time of the with block to the timer called name"""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add_time(name, time.perf_counter() - start)
+
+    def add_time(self, name, seconds):
+        """Record a duration measured elsewhere (e.g. in a worker process)"""
+        with self._lock:
+            timing = self.timings.setdefault(name, {'count': 0, 'seconds': 0.0, 'max': 0.0})
+            timing['count'] += 1
+            timing['seconds'] += seconds
+            timing['max'] = max(timing['max'], seconds)
+
+    def count(self, name, amount=1):
+        with self._lock:
+            self.counters[name] = self.counters.get(name, 0) + amount
+
+    def category(self, category_key, **values):
+        """Record figures (tools, status, ...) for one category"""
+        with self._lock:
+            self.categories.setdefault(category_key, {}).update(values)
+
+    def to_dict(self, script=None):
+        with self._lock:
+            return {
+                'script': script,
+                'argv': sys.argv[1:],
+                'started_at': datetime.fromtimestamp(self.started, timezone.utc).isoformat(),
+                'seconds': round(time.time() - self.started, 3),
+                'timings': {name: {**timing, 'seconds': round(timing['seconds'], 6), 'max': round(timing['max'], 6)}
+                            for name, timing in sorted(self.timings.items())},
+                'counters': dict(sorted(self.counters.items())),
+                'categories': self.categories,
+            }
+
+    def write(self, path, script=None):
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        tmp_path = path + '.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(self.to_dict(script), f, indent=2, ensure_ascii=False)
+        os.replace(tmp_path, path)
+
+
+report = RunReport()
+timer = report.timer
+add_time = report.add_time
+count = report.count
+record_category = report.category
+
+
+def add_arguments(parser):
+    """Add --report, --profile, -v and -q to a script's argument parser"""
+    group = parser.add_argument_group("instrumentation")
+    group.add_argument("--report", help="Write a JSON run report (timings, counters, per-category tools) here")
+    group.add_argument("--profile", help="Write cProfile stats here (inspect with python -m pstats)")
+    group.add_argument("-v", "--verbose", action="count", default=0, help="Print per-tool detail")
+    group.add_argument("-q", "--quiet", action="count", default=0, help="Only print warnings and summaries")
+
+
+def instrumented(args, script, func, *func_args, **func_kwargs):
+    """Run func with the verbosity, report and profile options from args"""
+    set_verbosity(NORMAL + args.verbose - args.quiet)
+    report.reset()
+    profiler = cProfile.Profile() if args.profile else None
+    try:
+        if profiler:
+            return profiler.runcall(func, *func_args, **func_kwargs)
+        return func(*func_args, **func_kwargs)
+    finally:
+        if profiler:
+            profiler.dump_stats(args.profile)
+            log(f"Profile written to {args.profile}", QUIET)
+        if args.report:
+            report.write(args.report, script)
+            log(f"Run report written to {args.report}", QUIET)
@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+"""
+Classify flattened toools.design link text into tool name, description and pricing.
+
+All lookup tables and the pricing pattern are built once at import time, and
+classify_link is a pure function so it can be unit-tested and benchmarked on
+its own.
+"""
+
+import re
+
+# Alternatives are ordered longest first so 'Free + Paid' and 'Freemium' win over 'Free'.
+# A badge starts at a word boundary or, since flattened link text glues it to the
+# description ('...checkerFree'), where a lower-case letter meets an upper-case one;
+# words like 'carefree', 'Prepaid' and 'royalty-free' are not badges. The trailing \b
+# keeps words like 'Freebies' from counting as a pricing badge. The leading lookahead
+# on the alternatives' first letters lets search skip other positions cheaply.
+PRICING_ALTERNATIVES = (
+    r'(?=[fpw])(?<!-)(?:\b|(?-i:(?<=[a-z])(?=[A-Z])))'
+    r'(?:(?P<FREE_PAID>free\s*\+\s*paid)'
+    r'|(?P<WITH_ATTRIBUTION>with\s+attribution)'
+    r'|(?P<FREEMIUM>freemium)'
+    r'|(?P<FREE>free)'
+    r'|(?P<PAID>paid))\b'
+)
+PRICING_PATTERN = re.compile(PRICING_ALTERNATIVES, re.IGNORECASE)
+
+# The badge ends the link text, so it is looked for in the last few characters first
+TRAILING_PRICING = re.compile(PRICING_ALTERNATIVES + r'\s*$', re.IGNORECASE)
+BADGE_WINDOW = 24
+
+PRICING_TAGS = {
+    'FREE_PAID': 'FREE + PAID',
+    'WITH_ATTRIBUTION': 'WITH ATTRIBUTION',
+    'FREEMIUM': 'FREEMIUM',
+    'FREE': 'FREE',
+    'PAID': 'PAID',
+}
+
+DEFAULT_PRICING = 'FREE'
+
+# Lower-case name words that still start a tool name
+NAME_WORDS = frozenset(['uicons', 'Heroicons', 'Lucide'])
+
+MAX_NAME_WORDS = 3
+
+# Default use cases based on category
+CATEGORY_USE_CASES = {
+    'icons': ['Icons', 'UI Design', 'Web Design'],
+    'illustrations': ['Illustrations', 'Graphics', 'Design'],
+    'typography': ['Fonts', 'Typography', 'Web Fonts'],
+    'color-tools': ['Color Palettes', 'Design', 'UI'],
+    'mockups': ['Mockups', 'Presentation', 'Design'],
+    'inspiration': ['Inspiration', 'Design Showcase', 'Gallery'],
+    'ai-tools': ['AI', 'Automation', 'Design'],
+    'design-tools': ['Design', 'UI/UX', 'Software'],
+    'ux-tools': ['UX', 'User Experience', 'Research'],
+    'accessibility': ['Accessibility', 'A11y', 'Inclusive Design'],
+    'learning': ['Learning', 'Education', 'Tutorial'],
+    'community': ['Community', 'Design Community', 'Networking'],
+    'blogs': ['Blog', 'Articles', 'Design Writing'],
+    'podcasts': ['Podcast', 'Audio', 'Design Discussion'],
+    'books': ['Books', 'Reading', 'Design Education'],
+    'stock-photos': ['Stock Photos', 'Photography', 'Images'],
+    'project-tools': ['Project Management', 'Collaboration', 'Workflow'],
+    'web-builder': ['Website Builder', 'No-Code', 'Web Development']
+}
+
+DEFAULT_USE_CASES = ['Design', 'Tools']
+
+# Site navigation links that look like tools
+SKIP_NAMES = frozenset(['home', 'blog', 'deals', 'image'])
+
+
+def use_cases_for(category_name):
+    """Shared default use-case list for a category"""
+    return CATEGORY_USE_CASES.get(category_name.lower(), DEFAULT_USE_CASES)
+
+
+def detect_pricing(text):
+    """Return (pricing, text) with a trailing pricing badge stripped from text.
+
+    A badge ending the text wins, since it follows the description; otherwise
+    the first pricing phrase anywhere is used and the text is left as-is.
+    """
+    match = TRAILING_PRICING.search(text, max(0, len(text) - BADGE_WINDOW))
+    if match:
+        return PRICING_TAGS[match.lastgroup], text[:match.start()].rstrip()
+    match = PRICING_PATTERN.search(text)
+    if match:
+        return PRICING_TAGS[match.lastgroup], text
+    return DEFAULT_PRICING, text
+
+
+def pricing_from_badge(text):
+    """Pricing tag for the text of a pricing badge element, or None if it has none"""
+    match = PRICING_PATTERN.search(text)
+    return PRICING_TAGS[match.lastgroup] if match else None
+
+
+def split_name(text):
+    """Split link text into (name, description).
+
+    Short texts are all name; otherwise the name is up to three leading
+    capitalised words, or the first two words when none are capitalised.
+    """
+    words = text.split()
+    if len(words) <= MAX_NAME_WORDS:
+        return text, ''
+
+    name_count = 0
+    for word in words[:MAX_NAME_WORDS]:
+        if not (word[0].isupper() or word in NAME_WORDS):
+            break
+        name_count += 1
+    if not name_count:
+        name_count = 2
+
+    return ' '.join(words[:name_count]), ' '.join(words[name_count:])
+
+
+def classify_link(text):
+    """Classify flattened link text as (name, description, pricing).
+
+    Returns None when the text is too short to be a tool link.
+    """
+    if len(text) < 3 or len(text.split(None, 1)) < 2:
+        return None
+
+    pricing, text = detect_pricing(text)
+    name, description = split_name(text)
+    name = name.strip()
+    if len(name) <= 1:
+        return None
+    return name, description, pricing
@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""
+Parse category pages in worker processes.
+
+Parsing is CPU-bound, so fetch threads hand page bodies to a
+ProcessPoolExecutor and carry on fetching; the executor's call queue is the
+hand-off between the two stages. Workers send tools back as compact rows
+(tuples in ROW_FIELDS order, without the per-category use cases) which are
+cheaper to pickle than dicts and are expanded in the parent.
+
+Pages are submitted from fetch threads, and forking a process that has
+threads running can copy a lock another thread holds and deadlock the
+child, so the workers are started from a fork server (spawned where that is
+not available) instead of forked from the crawler.
+"""
+
+import multiprocessing
+import os
+import time
+from concurrent.futures import Future, ProcessPoolExecutor
+
+from instrumentation import add_time, count
+from link_classifier import use_cases_for
+
+ROW_FIELDS = ('name', 'description', 'image', 'url', 'pricing')
+
+
+def start_method():
+    """A start method that is safe with threads running in the parent"""
+    methods = multiprocessing.get_all_start_methods()
+    return 'forkserver' if 'forkserver' in methods else 'spawn'
+
+
+def default_workers():
+    """One parse process per available core"""
+    try:
+        return len(os.sched_getaffinity(0))
+    except AttributeError:
+        return os.cpu_count() or 1
+
+
+def parse_rows(html, category_key, parser, page_url):
+    """Worker entry point: parse a page and return (rows, seconds)"""
+    # Imported here because scraper_updated imports this module. The
+    # uninstrumented parse: time and counts are recorded by ParsePool.result()
+    from scraper_updated import _parse_category_page
+
+    start = time.perf_counter()
+    tools = _parse_category_page(html, category_key, parser, page_url)
+    rows = [tuple(tool[field] for field in ROW_FIELDS) for tool in tools]
+    return rows, time.perf_counter() - start
+
+
+def rows_to_tools(rows, category_key):
+    """Expand compact rows back into tool dicts"""
+    use_cases = use_cases_for(category_key)
+    return [{**dict(zip(ROW_FIELDS, row)), 'use_cases': use_cases} for row in rows]
+
+
+class ParsePool:
+    """Submit pages for parsing and collect the tools later.
+
+    workers=0 parses in the calling thread instead, for environments where
+    starting processes is not worth it (or not possible).
+    """
+
+    def __init__(self, parser, workers=None):
+        self.workers = default_workers() if workers is None else workers
+        self.parser = parser
+        self._executor = None
+        if self.workers > 0:
+            self._executor = ProcessPoolExecutor(max_workers=self.workers,
+                                                 mp_context=multiprocessing.get_context(start_method()))
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def close(self):
+        if self._executor:
+            self._executor.shutdown()
+
+    def submit(self, html, category_key, page_url):
+        """Queue a page; returns a future of its compact rows"""
+        if self._executor:
+            return self._executor.submit(parse_rows, html, category_key, self.parser, page_url)
+        future = Future()
+        future.set_result(parse_rows(html, category_key, self.parser, page_url))
+        return future
+
+    def result(self, future, category_key):
+        """Wait for a submitted page and return its tools"""
+        rows, seconds = future.result()
+        add_time('parse', seconds)
+        count('pages_parsed')
+        count('tools_parsed', len(rows))
+        return rows_to_tools(rows, category_key)
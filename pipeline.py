@@ -0,0 +1,267 @@
+#!/usr/bin/env python3
+"""
+Single entry point for refreshing the tools database.
+
+The database is loaded once (as records.py records, or scraped), passed
+through the selected stages in memory and written once at the end:
+
+    scrape     crawl toools.design instead of loading data/design_tools_database.json
+    curate     apply the overrides in data/tool_overrides.json (fix_data.py)
+    image-fix  fill in missing images, optionally verify and mirror them (fix_images.py)
+    dedupe     collapse tools sharing a canonical URL (canonical.py)
+    index      build the search index and the derived views
+    feed       diff against the last feed build and append the changes to public/changes.jsonl
+
+Stages always run in that order; --stages/--skip choose which ones, and
+--dry-run reports what would change without writing anything.
+"""
+
+import argparse
+import hashlib
+import json
+import sys
+import time
+
+from canonical import dedupe_tools
+from change_feed import (FEED_FILE, SNAPSHOT_FILE, append_build, diff_snapshots, last_build, load_snapshot,
+                         save_snapshot, snapshot, summarize)
+from db_writer import DATABASE_TARGETS, file_hash, serialize, serialize_minified, write_database, write_targets
+from derived_views import COMPREHENSIVE_TARGETS, TOOLS_INDEX_TARGETS, build_views
+from discovery import FRONTIER_FILE, Frontier
+from fix_data import OVERRIDES_FILE, apply_overrides, load_overrides
+from fix_images import fix_database_images
+from http_client import DEFAULT_RETRIES
+from image_check import CHECK_CACHE_FILE, CHECK_TTL, ImageCheckCache
+from instrumentation import QUIET, add_arguments, instrumented, log, timer
+from records import load_records
+from response_cache import DEFAULT_CACHE_DIR, DEFAULT_TTL, ResponseCache
+from scraper_updated import BASE_URL, DEFAULT_PARSER, finish_scrape, scrape_database
+from search_index import INDEX_FILE, build_index
+
+DATABASE_FILE = DATABASE_TARGETS[0]
+
+
+def stage_scrape(run, args):
+    cache = None if args.no_cache else ResponseCache(args.cache_dir, ttl=args.cache_ttl)
+    frontier = Frontier(args.frontier) if args.discover else None
+    database, state, _, _, incomplete = scrape_database(
+        base_url=args.base_url, workers=args.workers, requests_per_second=args.rate,
+        retries=args.retries, cache=cache, offline=args.offline, incremental=args.incremental,
+        parser=args.parser, resume=args.resume, parse_workers=args.parse_workers,
+        frontier=frontier)
+    run['database'] = database
+    # Saved only once the output is written, so a dry run leaves the next incremental scrape alone
+    run['on_written'].append(lambda: finish_scrape(state, frontier, incomplete))
+    if incomplete:
+        run['failed'].append(f"scrape: not fully fetched: {', '.join(incomplete)}")
+
+
+def stage_curate(run, args):
+    apply_overrides(run['database'], load_overrides(args.overrides), fuzzy=not args.no_fuzzy)
+
+
+def stage_image_fix(run, args):
+    check_cache = ImageCheckCache(args.check_cache, ttl=args.check_ttl) if args.verify else None
+    # Mirroring writes icons and the source map as it goes, so a dry run leaves it out
+    mirror = args.mirror and not args.dry_run
+    if args.mirror and not mirror:
+        print("Dry run: not mirroring icons into public/icons")
+    fix_database_images(run['database'], verify=args.verify, mirror=mirror,
+                        workers=args.image_workers, requests_per_second=args.image_rate,
+                        check_cache=check_cache)
+
+
+def stage_dedupe(run, args):
+    run['database'], duplicates = dedupe_tools(run['database'])
+    print(f"Collapsed {duplicates} duplicate tools")
+
+
+def stage_index(run, args):
+    index = build_index(run['database'])
+    tools_index, comprehensive = build_views(run['database'])
+    run['outputs'] += [
+        (serialize_minified(index), [INDEX_FILE]),
+        (serialize(tools_index), TOOLS_INDEX_TARGETS),
+        (serialize(comprehensive), COMPREHENSIVE_TARGETS),
+    ]
+    print(f"Search index: {len(index['terms'])} terms over {len(index['tools'])} tools")
+
+
+def previous_feed_build(args):
+    """(build, snapshot, stored) of the build the feed last recorded.
+
+    Without a stored snapshot (first run, cleared cache) the database file
+    this build replaces stands in for it and stored is False.
+    """
+    stored = load_snapshot(args.feed_snapshot)
+    if stored:
+        build, tools = stored
+        if build < last_build(args.feed):
+            log(f"{args.feed_snapshot} is older than build {last_build(args.feed)} of {args.feed}; "
+                "changes already in the feed may be listed again", QUIET)
+        return build, tools, True
+    try:
+        with open(args.database, 'r', encoding='utf-8') as f:
+            previous = json.load(f)
+    except (OSError, ValueError):
+        return 0, {}, False
+    return previous['meta'].get('build', 0), snapshot(previous), False
+
+
+def stage_feed(run, args):
+    database = run['database']
+    previous_build, previous, stored = previous_feed_build(args)
+    current = snapshot(database)
+
+    changes = diff_snapshots(previous, current)
+    summary = summarize(changes)
+    print(f"Changes since build {previous_build}: +{summary['added']} -{summary['removed']} ~{summary['modified']}")
+    if not changes:
+        if previous_build:
+            database['meta']['build'] = previous_build
+        if not stored and not args.dry_run:
+            # Start tracking from this build so later edits are diffed against it
+            run['on_written'].append(lambda: save_snapshot(previous_build, current, args.feed_snapshot))
+        return
+
+    build = max(last_build(args.feed), previous_build) + 1
+    database['meta']['build'] = build
+    total_tools = sum(len(category['tools']) for category in database['categories'].values())
+    if args.dry_run:
+        print(f"Would append build {build} to {args.feed}")
+        return
+
+    def append():
+        append_build(build, changes, total_tools, args.feed)
+        save_snapshot(build, current, args.feed_snapshot)
+        print(f"Appended build {build} ({len(changes)} changes) to {args.feed}")
+    run['on_written'].append(append)
+
+
+# Registered stages in execution order
+STAGES = {
+    'scrape': stage_scrape,
+    'curate': stage_curate,
+    'image-fix': stage_image_fix,
+    'dedupe': stage_dedupe,
+    'index': stage_index,
+    'feed': stage_feed,
+}
+
+
+def run_pipeline(stages, args, dry_run=False):
+    """Run the selected stages in registry order and write the result once.
+
+    Returns the final database, a list of (step, seconds) timings and the
+    problems that should make the run exit non-zero.
+    """
+    run = {'database': None, 'outputs': [], 'on_written': [], 'failed': []}
+    timings = []
+
+    if 'scrape' not in stages:
+        start = time.perf_counter()
+        with timer('stage.load'):
+            run['database'] = load_records(args.database)
+        timings.append(('load', time.perf_counter() - start))
+
+    for name, stage in STAGES.items():
+        if name not in stages:
+            continue
+        print(f"\n=== {name} ===")
+        start = time.perf_counter()
+        with timer(f"stage.{name}"):
+            stage(run, args)
+        timings.append((name, time.perf_counter() - start))
+
+    database = run['database']
+    database['meta']['total_tools'] = sum(len(category['tools']) for category in database['categories'].values())
+
+    print("\n=== write ===")
+    start = time.perf_counter()
+    with timer('stage.write'):
+        write_outputs(database, run, dry_run)
+    timings.append(('write', time.perf_counter() - start))
+
+    return database, timings, run['failed']
+
+
+def write_outputs(database, run, dry_run=False):
+    """Write the database and the stage outputs, or report what would change"""
+    if dry_run:
+        pretty = serialize(database)
+        for payload, paths in [(pretty, DATABASE_TARGETS)] + run['outputs']:
+            digest = hashlib.sha256(payload).hexdigest()
+            for path in paths:
+                print(f"{'Unchanged' if file_hash(path) == digest else 'Would update'}: {path}")
+        print("Dry run: nothing written (compact variants and shards follow the database copies)")
+    else:
+        write_database(database)
+        for payload, paths in run['outputs']:
+            written = write_targets(payload, paths)
+            for path in paths:
+                print(f"{'Updated' if path in written else 'Unchanged'}: {path}")
+        for callback in run['on_written']:
+            callback()
+
+
+def print_timings(timings):
+    total = sum(seconds for _, seconds in timings)
+    print(f"\n{'step':<12}{'seconds':>10}{'share':>8}")
+    for name, seconds in timings:
+        print(f"{name:<12}{seconds:>10.2f}{seconds / total if total else 0:>8.0%}")
+    print(f"{'total':<12}{total:>10.2f}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Refresh the tools database in one load and one write",
+                                     formatter_class=argparse.RawDescriptionHelpFormatter,
+                                     epilog=__doc__.split('\n\n')[1])
+    parser.add_argument("--stages", nargs='+', choices=STAGES, default=list(STAGES),
+                        help="Stages to run (default: all)")
+    parser.add_argument("--skip", nargs='+', choices=STAGES, default=[], help="Stages to leave out")
+    parser.add_argument("--dry-run", action="store_true", help="Run the stages but only report which files would change")
+    parser.add_argument("--database", default=DATABASE_FILE, help="Database to load when not scraping")
+
+    scrape = parser.add_argument_group("scrape")
+    scrape.add_argument("--base-url", default=BASE_URL, help="Site root to crawl (e.g. a local mirror)")
+    scrape.add_argument("--workers", type=int, default=4, help="Concurrent page fetches (1 = sequential)")
+    scrape.add_argument("--rate", type=float, default=2.0, help="Max page requests per second per host")
+    scrape.add_argument("--retries", type=int, default=DEFAULT_RETRIES, help="Retries per page on 429/5xx and connection errors")
+    scrape.add_argument("--cache-dir", default=DEFAULT_CACHE_DIR, help="Directory for cached page responses")
+    scrape.add_argument("--cache-ttl", type=int, default=DEFAULT_TTL, help="Seconds a cached page is reused without revalidation")
+    scrape.add_argument("--no-cache", action="store_true", help="Always download pages and skip the response cache")
+    scrape.add_argument("--offline", action="store_true", help="Parse only from the response cache")
+    scrape.add_argument("--resume", action="store_true", help="Skip categories finished by an interrupted run")
+    scrape.add_argument("--parser", default=DEFAULT_PARSER, choices=["lxml", "html.parser"], help="BeautifulSoup backend")
+    scrape.add_argument("--incremental", action="store_true", help="Only re-parse categories whose pages changed")
+    scrape.add_argument("--parse-workers", type=int, default=None,
+                        help="Parse processes (default: one per core, 0 = parse in the fetch threads)")
+    scrape.add_argument("--discover", action="store_true", help="Find categories from the sitemap and nav links")
+    scrape.add_argument("--frontier", default=FRONTIER_FILE, help="Per-URL discovery state for --discover")
+
+    curate = parser.add_argument_group("curate")
+    curate.add_argument("--overrides", default=OVERRIDES_FILE, help="JSON file of overrides keyed by category")
+    curate.add_argument("--no-fuzzy", action="store_true", help="Only match overrides by exact name or URL")
+
+    images = parser.add_argument_group("image-fix")
+    images.add_argument("--verify", action="store_true", help="Request every image URL and use the placeholder for broken ones")
+    images.add_argument("--mirror", action="store_true", help="Download icons into public/icons")
+    images.add_argument("--image-workers", type=int, default=8, help="Concurrent image checks and downloads")
+    images.add_argument("--image-rate", type=float, default=10.0, help="Max image requests per second per host")
+    images.add_argument("--check-cache", default=CHECK_CACHE_FILE, help="Image check result cache")
+    images.add_argument("--check-ttl", type=int, default=CHECK_TTL, help="Seconds a cached check result is trusted")
+    feed = parser.add_argument_group("feed")
+    feed.add_argument("--feed", default=FEED_FILE, help="Append-only JSONL change feed")
+    feed.add_argument("--feed-snapshot", default=SNAPSHOT_FILE, help="Snapshot of the last build in the feed")
+    add_arguments(parser)
+    args = parser.parse_args()
+
+    if args.offline and args.no_cache:
+        parser.error("--offline needs the response cache")
+    stages = [name for name in args.stages if name not in args.skip]
+    print(f"Stages: {', '.join(name for name in STAGES if name in stages) or 'none'}")
+
+    _, timings, failed = instrumented(args, "pipeline", run_pipeline, stages, args, dry_run=args.dry_run)
+    print_timings(timings)
+    if failed:
+        sys.exit('\n'.join(failed))
@@ -0,0 +1,201 @@
+#!/usr/bin/env python3
+"""
+Compact in-memory records for tools and categories.
+
+A tool loaded from JSON is a dict holding its own pricing string and its own
+use_cases list, although there are only a handful of pricing values and one
+use-case list per category. Tool and Category are __slots__ records in which
+those values, and each record's key layout, are shared instances: pricing
+strings and use-case lists are interned, so 100k tools of one category
+point at the same list instead of holding 100k copies. As with
+link_classifier.use_cases_for(), shared lists are treated as read-only;
+assign a new list to change a tool's use cases.
+
+Records are mutable mappings with the keys of the JSON object they came
+from, so the passes written against dicts (overrides, image fixes, dedupe,
+the index and views) run on them unchanged, and db_writer serializes them
+like the dicts. Conversion is lossless: to_dict() gives back the same keys in
+the same order, and keys a record has no slot for are carried in a side
+dict, so db_writer.serialize(records_to_database(records)) is byte-identical
+to serializing the original.
+"""
+
+from collections.abc import MutableMapping
+
+from db_stream import iter_categories
+from link_classifier import CATEGORY_USE_CASES, DEFAULT_USE_CASES, PRICING_TAGS
+
+# One instance per distinct pricing value, use-case list and key layout
+_shared = {}
+
+
+def share(value):
+    """The shared instance equal to value"""
+    try:
+        key = (list, tuple(value)) if isinstance(value, list) else value
+        return _shared.setdefault(key, value)
+    except TypeError:
+        # Unhashable (e.g. a list of dicts): keep the value's own copy
+        return value
+
+
+for _value in list(PRICING_TAGS.values()) + list(CATEGORY_USE_CASES.values()) + [DEFAULT_USE_CASES]:
+    share(_value)
+
+
+class _Record(MutableMapping):
+    """Mapping over a record's slots, in the key order of the object it was built from.
+
+    _keys is the shared key layout; keys outside FIELDS live in _extra.
+    """
+
+    __slots__ = ()
+
+    FIELDS = ()
+    SHARED = ()
+
+    def __getitem__(self, key):
+        if key not in self._keys:
+            raise KeyError(key)
+        return getattr(self, key) if key in self.FIELDS else self._extra[key]
+
+    def __setitem__(self, key, value):
+        if key in self.FIELDS:
+            setattr(self, key, share(value) if key in self.SHARED else value)
+        else:
+            if self._extra is None:
+                self._extra = {}
+            self._extra[key] = value
+        if key not in self._keys:
+            self._keys = share(self._keys + (key,))
+
+    def __delitem__(self, key):
+        if key not in self._keys:
+            raise KeyError(key)
+        if key in self.FIELDS:
+            setattr(self, key, None)
+        else:
+            del self._extra[key]
+        self._keys = share(tuple(name for name in self._keys if name != key))
+
+    def __iter__(self):
+        return iter(self._keys)
+
+    def __len__(self):
+        return len(self._keys)
+
+    def __contains__(self, key):
+        return key in self._keys
+
+    def get(self, key, default=None):
+        return self[key] if key in self._keys else default
+
+    def to_dict(self):
+        return dict(self)
+
+    def copy(self):
+        """Shallow copy, like dict.copy()"""
+        record = self.__class__.__new__(self.__class__)
+        for field in self.FIELDS:
+            setattr(record, field, getattr(self, field))
+        record._keys = self._keys
+        record._extra = dict(self._extra) if self._extra else None
+        return record
+
+
+class Tool(_Record):
+    """One tool; pricing and use_cases are shared with every tool that has the same value"""
+
+    __slots__ = ('name', 'description', 'image', 'url', 'pricing', 'use_cases', '_keys', '_extra')
+
+    FIELDS = ('name', 'description', 'image', 'url', 'pricing', 'use_cases')
+    SHARED = ('pricing', 'use_cases')
+
+    def __init__(self, name, description='', image='', url='', pricing='', use_cases=()):
+        self.name = name
+        self.description = description
+        self.image = image
+        self.url = url
+        self.pricing = share(pricing)
+        self.use_cases = share(list(use_cases))
+        self._keys = self.FIELDS
+        self._extra = None
+
+    @classmethod
+    def from_dict(cls, tool):
+        record = cls.__new__(cls)
+        for field in cls.FIELDS:
+            setattr(record, field, None)
+        extra = None
+        for key, value in tool.items():
+            if key in cls.SHARED:
+                value = share(value)
+            elif key not in cls.FIELDS:
+                extra = extra or {}
+                extra[key] = value
+                continue
+            setattr(record, key, value)
+        record._keys = share(tuple(tool))
+        record._extra = extra
+        return record
+
+    def __repr__(self):
+        return f"Tool({self.name!r}, {self.url!r})"
+
+
+class Category(_Record):
+    """A category's name, description and Tool records"""
+
+    __slots__ = ('name', 'description', 'tools', '_keys', '_extra')
+
+    FIELDS = ('name', 'description', 'tools')
+
+    def __init__(self, name, description='', tools=None):
+        self.name = name
+        self.description = description
+        self.tools = tools if tools is not None else []
+        self._keys = self.FIELDS
+        self._extra = None
+
+    @classmethod
+    def from_dict(cls, category):
+        record = cls(category.get('name'), category.get('description'),
+                     [Tool.from_dict(tool) for tool in category.get('tools', [])])
+        extra = {key: value for key, value in category.items() if key not in cls.FIELDS}
+        record._keys = share(tuple(category))
+        record._extra = extra or None
+        return record
+
+    def to_dict(self):
+        return plain_category(self)
+
+    def __repr__(self):
+        return f"Category({self.name!r}, {len(self.tools)} tools)"
+
+
+def database_to_records(database):
+    """The database with every category (and its tools) as records"""
+    return {**database, 'categories': {key: Category.from_dict(category)
+                                       for key, category in database['categories'].items()}}
+
+
+def plain_category(category):
+    """A category (record or dict, with record or dict tools) as plain dicts"""
+    return {**category, 'tools': [dict(tool) for tool in category['tools']]}
+
+
+def records_to_database(records):
+    """The plain JSON shape of a database holding records, also after passes that mixed in dicts"""
+    return {**records, 'categories': {key: plain_category(category)
+                                      for key, category in records['categories'].items()}}
+
+
+def load_records(path):
+    """Read a database file straight into records, one category at a time.
+
+    Only one category is ever held as dicts, so peak memory is the records
+    plus the largest category rather than the records plus the whole file.
+    """
+    head = {}
+    categories = {key: Category.from_dict(category) for key, category in iter_categories(path, head)}
+    return {**head, 'categories': categories}
@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+"""
+Persistent on-disk HTTP response cache keyed by URL.
+
+Each entry keeps the body plus its ETag / Last-Modified validators so later
+runs can revalidate with a conditional request instead of downloading again.
+"""
+
+import hashlib
+import json
+import os
+import threading
+import time
+
+DEFAULT_CACHE_DIR = ".cache/http"
+DEFAULT_TTL = 3600  # seconds an entry is served without revalidation
+DEFAULT_MAX_BYTES = 100 * 1024 * 1024
+
+
+class ResponseCache:
+    """URL-keyed body store with TTL freshness and size-bounded LRU eviction"""
+
+    def __init__(self, directory=DEFAULT_CACHE_DIR, ttl=DEFAULT_TTL, max_bytes=DEFAULT_MAX_BYTES):
+        self.directory = directory
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        os.makedirs(directory, exist_ok=True)
+
+    def _paths(self, url):
+        key = hashlib.sha256(url.encode('utf-8')).hexdigest()
+        base = os.path.join(self.directory, key)
+        return base + '.json', base + '.body'
+
+    def _write_meta(self, meta_path, entry):
+        tmp_path = meta_path + '.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(entry, f)
+        os.replace(tmp_path, meta_path)
+
+    def get(self, url):
+        """Return the metadata entry for url, or None if it is not cached"""
+        meta_path, body_path = self._paths(url)
+        with self._lock:
+            try:
+                with open(meta_path, 'r', encoding='utf-8') as f:
+                    entry = json.load(f)
+            except (OSError, ValueError):
+                return None
+            if not os.path.exists(body_path):
+                return None
+            entry['last_access'] = time.time()
+            self._write_meta(meta_path, entry)
+            return entry
+
+    def read_body(self, url):
+        """Return the cached body bytes for url"""
+        _, body_path = self._paths(url)
+        with open(body_path, 'rb') as f:
+            return f.read()
+
+    def is_fresh(self, entry):
+        """True while an entry is younger than the TTL"""
+        return time.time() - entry['fetched_at'] < self.ttl
+
+    def validators(self, entry):
+        """Conditional request headers for revalidating an entry"""
+        headers = {}
+        if entry.get('etag'):
+            headers['If-None-Match'] = entry['etag']
+        if entry.get('last_modified'):
+            headers['If-Modified-Since'] = entry['last_modified']
+        return headers
+
+    def put(self, url, body, etag=None, last_modified=None):
+        """Store a freshly downloaded body and its validators"""
+        meta_path, body_path = self._paths(url)
+        now = time.time()
+        entry = {
+            'url': url,
+            'etag': etag,
+            'last_modified': last_modified,
+            'fetched_at': now,
+            'last_access': now,
+            'size': len(body),
+        }
+        with self._lock:
+            tmp_path = body_path + '.tmp'
+            with open(tmp_path, 'wb') as f:
+                f.write(body)
+            os.replace(tmp_path, body_path)
+            self._write_meta(meta_path, entry)
+        self.evict()
+        return entry
+
+    def touch(self, url, entry):
+        """Mark an entry as revalidated after a 304 Not Modified"""
+        meta_path, _ = self._paths(url)
+        entry['fetched_at'] = time.time()
+        with self._lock:
+            self._write_meta(meta_path, entry)
+
+    def evict(self):
+        """Drop least recently used entries until the cache fits in max_bytes"""
+        with self._lock:
+            entries = []
+            total = 0
+            for filename in os.listdir(self.directory):
+                if not filename.endswith('.json'):
+                    continue
+                meta_path = os.path.join(self.directory, filename)
+                try:
+                    with open(meta_path, 'r', encoding='utf-8') as f:
+                        entry = json.load(f)
+                except (OSError, ValueError):
+                    continue
+                entries.append((entry.get('last_access', 0), meta_path, entry.get('size', 0)))
+                total += entry.get('size', 0)
+
+            removed = 0
+            for _, meta_path, size in sorted(entries):
+                if total <= self.max_bytes:
+                    break
+                for path in (meta_path, meta_path[:-len('.json')] + '.body'):
+                    try:
+                        os.remove(path)
+                    except FileNotFoundError:
+                        pass
+                total -= size
+                removed += 1
+            return removed
@@ -3,23 +3,19 @@
 Enhanced scraper for toools.design with image extraction
 """
 
-import requests
 from bs4 import BeautifulSoup
-import json
 import time
-import os
 from urllib.parse import urljoin, urlparse
 
+from db_writer import write_database
+from http_client import fetch
+
 def scrape_category_page(url, category_name):
     """Scrape a category page and extract tool information including images"""
     print(f"Scraping {category_name}: {url}")
     
     try:
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-        }
-        response = requests.get(url, headers=headers)
-        response.raise_for_status()
+        response = fetch(url)
         
         soup = BeautifulSoup(response.content, 'html.parser')
         tools = []
@@ -299,10 +295,7 @@ def scrape_toools_design():
     
     # Save to JSON file
     output_file = "data/design_tools_database.json"
-    os.makedirs("data", exist_ok=True)
-    
-    with open(output_file, 'w', encoding='utf-8') as f:
-        json.dump(database, f, indent=2, ensure_ascii=False)
+    write_database(database, [output_file], compact=False)
     
     print(f"\n=== Scraping Complete ===")
     print(f"Total tools: {total_tools}")
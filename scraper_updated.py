@@ -3,34 +3,122 @@
 Updated scraper for toools.design current structure
 """
 
-import requests
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
+import argparse
+import hashlib
 import json
-import time
 import os
 import re
+import sys
 from urllib.parse import urljoin, urlparse
 
-def scrape_category_page(url, category_name):
-    """Scrape a category page and extract tool information"""
-    print(f"Scraping {category_name}: {url}")
+from canonical import dedupe_tools
+from checkpoint import CheckpointJournal
+from crawler import HostRateLimiter, crawl_completed
+from db_writer import DATABASE_TARGETS, expand_memberships, write_database
+from discovery import FRONTIER_FILE, Frontier, discover_categories
+from http_client import DEFAULT_RETRIES, FetchError, fetch, get_session
+from instrumentation import DETAIL, QUIET, add_arguments, count, instrumented, log, record_category, timer
+from link_classifier import BADGE_WINDOW, DEFAULT_PRICING, SKIP_NAMES, classify_link, pricing_from_badge, use_cases_for
+from parse_pool import ParsePool
+from response_cache import DEFAULT_CACHE_DIR, DEFAULT_TTL, ResponseCache
+from search_index import write_index
+
+BASE_URL = "https://www.toools.design"
+
+OUTPUT_FILE = DATABASE_TARGETS[0]
+STATE_FILE = ".cache/scrape_state.json"
+JOURNAL_FILE = ".cache/scrape_journal.jsonl"
+
+# lxml is several times faster than the pure-Python parser; fall back when it is missing
+try:
+    import lxml  # noqa: F401
+    DEFAULT_PARSER = "lxml"
+except ImportError:
+    DEFAULT_PARSER = "html.parser"
+
+# Tools are plain links, so only <a href> subtrees need to be built
+TOOL_LINKS = SoupStrainer('a', href=True)
+
+def fetch_category_page(url, category_name, retries=DEFAULT_RETRIES, cache=None, offline=False):
+    """Download a category page, returning its body or None if it could not be fetched"""
+    log(f"Fetching {category_name}: {url}", DETAIL)
     
     try:
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-        }
-        response = requests.get(url, headers=headers)
-        response.raise_for_status()
-        
-        soup = BeautifulSoup(response.content, 'html.parser')
+        with timer('fetch'):
+            response = fetch(url, retries=retries, cache=cache, offline=offline)
+    except FetchError as e:
+        count('fetch_errors')
+        log(f"Error fetching {url}: {e}", QUIET)
+        return None
+    count('pages_fetched')
+    if getattr(response, 'from_cache', False):
+        count('cache_hits')
+    else:
+        count('bytes_downloaded', len(response.content))
+    return response.content
+
+# Card child elements, as used by the site's collection item markup
+NAME_TAGS = ['h2', 'h3', 'h4', 'h5']
+NAME_CLASS = re.compile(r'name|title', re.I)
+DESCRIPTION_CLASS = re.compile(r'desc|summary|excerpt', re.I)
+BADGE_CLASS = re.compile(r'pricing|price|badge|tag', re.I)
+
+def extract_card(link, page_url=BASE_URL):
+    """Read name, description, pricing and image from a tool card's child elements.
+    
+    Returns (name, description, pricing, image_url), or None when the link does
+    not carry card markup and the flattened text has to be classified instead.
+    """
+    heading = link.find(NAME_TAGS) or link.find(class_=NAME_CLASS)
+    if heading is None:
+        return None
+    name = heading.get_text(' ', strip=True)
+    if len(name) <= 1:
+        return None
+    
+    paragraph = link.find('p') or link.find(class_=DESCRIPTION_CLASS)
+    description = paragraph.get_text(' ', strip=True) if paragraph else ""
+    
+    pricing = None
+    badge = link.find(class_=BADGE_CLASS)
+    if badge is not None and badge is not heading:
+        pricing = pricing_from_badge(badge.get_text(' ', strip=True))
+    if pricing is None:
+        # Unlabelled badge: a loose text node outside heading and paragraph
+        for string in link.find_all(string=True):
+            if string.parent is heading or string.parent is paragraph or len(string) > BADGE_WINDOW:
+                continue
+            pricing = pricing_from_badge(string)
+            if pricing:
+                break
+    
+    image_url = ""
+    img = link.find('img')
+    if img is not None:
+        image_url = img.get('src') or img.get('data-src') or ""
+        if image_url and not image_url.startswith(('http', 'data:')):
+            image_url = urljoin(page_url, image_url)
+    
+    return name, description, pricing or DEFAULT_PRICING, image_url
+
+def parse_category_page(html, category_name, parser=DEFAULT_PARSER, page_url=BASE_URL):
+    """Extract tool information from a category page's HTML"""
+    with timer('parse'):
+        tools = _parse_category_page(html, category_name, parser, page_url)
+    count('pages_parsed')
+    count('tools_parsed', len(tools))
+    return tools
+
+def _parse_category_page(html, category_name, parser, page_url):
+    try:
+        soup = BeautifulSoup(html, parser, parse_only=TOOL_LINKS)
         tools = []
         
         # Find tool links - they are simple links with tool names and descriptions
         # Looking for pattern: [Tool Name Description PRICING_TAG](url)
-        text_content = soup.get_text()
-        
-        # Find all links that match the pattern
         links = soup.find_all('a', href=True)
+        use_cases = use_cases_for(category_name)
         
         for link in links:
             try:
@@ -38,92 +126,33 @@ def scrape_category_page(url, category_name):
                 if not url_href or url_href.startswith('#') or 'toools.design' in url_href:
                     continue
                 
-                link_text = link.get_text(strip=True)
-                if not link_text or len(link_text) < 3:
-                    continue
-                
-                # Try to parse the link text to extract name, description, and pricing
-                parts = link_text.split()
-                if len(parts) < 2:
-                    continue
-                
-                # Look for pricing tags at the end
-                pricing_tags = ['FREE', 'PAID', 'FREEMIUM', 'FREE + PAID', 'WITH ATTRIBUTION']
-                pricing = 'FREE'  # default
-                
-                for tag in pricing_tags:
-                    if tag in link_text.upper():
-                        pricing = tag
-                        link_text = link_text.replace(tag, '').strip()
-                        break
-                
-                # Try to separate name from description
-                # Usually the first few words are the name
-                words = link_text.split()
-                if len(words) >= 2:
-                    # First 1-3 words are likely the name
-                    if len(words) <= 3:
-                        name = link_text
-                        description = ""
-                    else:
-                        # Try to find where the name ends and description begins
-                        name_words = []
-                        desc_words = []
-                        
-                        # Look for capital letters or common patterns
-                        for i, word in enumerate(words):
-                            if i < 3 and (word[0].isupper() or word in ['uicons', 'Heroicons', 'Lucide']):
-                                name_words.append(word)
-                            else:
-                                desc_words.extend(words[i:])
-                                break
-                        
-                        if not name_words:
-                            name_words = words[:2]
-                            desc_words = words[2:]
-                        
-                        name = ' '.join(name_words)
-                        description = ' '.join(desc_words)
+                card = extract_card(link, page_url)
+                if card:
+                    name, description, pricing, image_url = card
+                else:
+                    # No card structure: fall back to splitting the flattened link text
+                    classified = classify_link(link.get_text(strip=True))
+                    if not classified:
+                        continue
+                    name, description, pricing = classified
+                    image_url = ""
                 
-                # Get favicon as image
-                domain = urlparse(url_href).netloc
-                image_url = f"https://{domain}/favicon.ico"
+                if not image_url:
+                    # Get favicon as image
+                    domain = urlparse(url_href).netloc
+                    image_url = f"https://{domain}/favicon.ico"
                 
-                # Default use cases based on category
-                category_use_cases = {
-                    'icons': ['Icons', 'UI Design', 'Web Design'],
-                    'illustrations': ['Illustrations', 'Graphics', 'Design'],
-                    'typography': ['Fonts', 'Typography', 'Web Fonts'],
-                    'color-tools': ['Color Palettes', 'Design', 'UI'],
-                    'mockups': ['Mockups', 'Presentation', 'Design'],
-                    'inspiration': ['Inspiration', 'Design Showcase', 'Gallery'],
-                    'ai-tools': ['AI', 'Automation', 'Design'],
-                    'design-tools': ['Design', 'UI/UX', 'Software'],
-                    'ux-tools': ['UX', 'User Experience', 'Research'],
-                    'accessibility': ['Accessibility', 'A11y', 'Inclusive Design'],
-                    'learning': ['Learning', 'Education', 'Tutorial'],
-                    'community': ['Community', 'Design Community', 'Networking'],
-                    'blogs': ['Blog', 'Articles', 'Design Writing'],
-                    'podcasts': ['Podcast', 'Audio', 'Design Discussion'],
-                    'books': ['Books', 'Reading', 'Design Education'],
-                    'stock-photos': ['Stock Photos', 'Photography', 'Images'],
-                    'project-tools': ['Project Management', 'Collaboration', 'Workflow'],
-                    'web-builder': ['Website Builder', 'No-Code', 'Web Development']
-                }
-                use_cases = category_use_cases.get(category_name.lower(), ['Design', 'Tools'])
-                
-                if name and len(name.strip()) > 1:
-                    tools.append({
-                        'name': name.strip(),
-                        'description': description.strip() if description else f"A useful tool for {category_name.lower()}",
-                        'image': image_url,
-                        'url': url_href,
-                        'pricing': pricing,
-                        'use_cases': use_cases
-                    })
+                tools.append({
+                    'name': name,
+                    'description': description or f"A useful tool for {category_name.lower()}",
+                    'image': image_url,
+                    'url': url_href,
+                    'pricing': pricing,
+                    'use_cases': use_cases
+                })
                     
             except Exception as e:
-                print(f"Error processing link: {e}")
+                log(f"Error processing link: {e}", QUIET)
                 continue
         
         # Remove duplicates and very short names
@@ -134,22 +163,49 @@ def scrape_category_page(url, category_name):
             name_lower = tool['name'].lower()
             if (name_lower not in seen_names and 
                 len(tool['name']) > 2 and 
-                not tool['name'].lower() in ['home', 'blog', 'deals', 'image']):
+                name_lower not in SKIP_NAMES):
                 unique_tools.append(tool)
                 seen_names.add(name_lower)
         
         return unique_tools
         
     except Exception as e:
-        print(f"Error scraping {url}: {e}")
+        log(f"Error parsing {category_name} page: {e}", QUIET)
         return []
 
-def scrape_toools_design():
-    """Main scraping function"""
-    base_url = "https://www.toools.design"
-    
-    # Define categories with their URLs
-    categories = {
+def scrape_category_page(url, category_name, retries=DEFAULT_RETRIES, cache=None, offline=False,
+                         parser=DEFAULT_PARSER):
+    """Scrape a category page and extract tool information"""
+    html = fetch_category_page(url, category_name, retries=retries, cache=cache, offline=offline)
+    if html is None:
+        return []
+    return parse_category_page(html, category_name, parser=parser, page_url=url)
+
+def content_hash(body):
+    """Stable fingerprint of a page body for change detection"""
+    return hashlib.sha256(body).hexdigest()
+
+def load_json(path, default=None):
+    """Load a JSON file, returning default when it is missing or unreadable"""
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return default
+
+def diff_tools(old_tools, new_tools):
+    """Count added, removed and changed tools between two versions of a category"""
+    old = {tool['name'].lower(): tool for tool in old_tools}
+    new = {tool['name'].lower(): tool for tool in new_tools}
+    return {
+        'added': len(new.keys() - old.keys()),
+        'removed': len(old.keys() - new.keys()),
+        'changed': sum(1 for name in new.keys() & old.keys() if new[name] != old[name]),
+    }
+
+def get_categories(base_url=BASE_URL):
+    """Return the category definitions with their URLs under base_url"""
+    return {
         "inspiration": {
             "name": "Inspiration",
             "description": "Design inspiration, galleries, and showcases",
@@ -241,6 +297,59 @@ def scrape_toools_design():
             "urls": [f"{base_url}/best-no-code-website-builder"]
         }
     }
+
+def scrape_database(base_url=BASE_URL, workers=4, requests_per_second=2.0, retries=DEFAULT_RETRIES,
+                    cache=None, offline=False, incremental=False, parser=DEFAULT_PARSER, resume=False,
+                    parse_workers=None, frontier=None):
+    """Crawl every category and assemble the raw database in memory.
+
+    Categories are crawled concurrently and each finished category is
+    appended to a checkpoint journal; with resume=True categories already in
+    the journal are skipped, and the database is assembled from the journal
+    once every category is done.
+
+    In incremental mode each page body is hashed and compared with the hashes
+    recorded by the previous run; categories whose pages are all unchanged keep
+    the tools parsed last time without being parsed again.
+
+    Fetch threads only download: pages to parse are queued on a process pool
+    of parse_workers processes (default: one per core, 0 parses in the
+    calling thread), so parsing overlaps with fetching and is not bound by
+    the GIL. A category's tools are collected, and the category journaled,
+    as soon as its pages are fetched rather than after the whole crawl.
+
+    With a discovery.Frontier the categories come from the site's sitemap and
+    navigation instead of the built-in list (see discover_categories), and
+    categories whose sitemap lastmod is unchanged since they were last
+    fetched keep their previous tools without being fetched at all.
+
+    A category whose pages could not all be fetched keeps its previous
+    tools (from the incremental state, or else from the current database
+    file) instead of being dropped, is not journaled and is listed in
+    incomplete.
+
+    Returns (database, state, changes, unchanged, incomplete). Nothing is
+    written besides the journal: call finish_scrape(state, frontier,
+    incomplete) once the output is saved.
+    """
+    get_session(pool_size=max(workers, 10))
+    if offline and cache is None:
+        raise ValueError("offline mode needs a response cache")
+    
+    # Politeness comes from the per-host rate limit rather than a fixed sleep after each page
+    rate_limiter = None if offline else HostRateLimiter(requests_per_second)
+    
+    def fetch_page(url, category_key):
+        if rate_limiter:
+            rate_limiter.wait(url)
+        return fetch_category_page(url, category_key, retries=retries, cache=cache, offline=offline)
+    
+    known = get_categories(base_url)
+    if frontier is not None:
+        with timer('discover'):
+            categories = discover_categories(base_url, lambda url: fetch_page(url, 'discovery'), frontier, known)
+    else:
+        categories = known
     
     database = {
         "meta": {
@@ -254,15 +363,124 @@ def scrape_toools_design():
     
     total_tools = 0
     
+    # The state keeps each category's page hashes and tools as parsed, before
+    # deduplication and the fix_* passes, so carried-over categories stay raw
+    previous_state = load_json(STATE_FILE, {}) if incremental or frontier is not None else {}
+    
+    journal = CheckpointJournal(JOURNAL_FILE)
+    if resume:
+        finished = journal.load()
+        if finished:
+            log(f"Resuming: {len(finished)} categories already in {JOURNAL_FILE}")
+    else:
+        journal.reset()
+        finished = {}
+    
+    def previous_block(category_key):
+        block = previous_state.get(category_key)
+        # State written before tools were recorded cannot be carried over
+        return block if block and 'tools' in block else None
+    
+    current = None
+    
+    def current_tools(category_key):
+        """The category's tools in the database this run replaces (with tools collapsed elsewhere), or None"""
+        nonlocal current
+        if current is None:
+            database_file = load_json(OUTPUT_FILE, {}) or {}
+            current = {key: category['tools'] for key, category, _
+                       in expand_memberships(database_file.get('categories', {}).items())}
+        return current.get(category_key)
+    
+    def scrape_category(category_key, category_info):
+        previous = previous_block(category_key)
+        if (frontier is not None and previous and set(previous['hashes']) == set(category_info['urls'])
+                and not any(frontier.needs_fetch(url) for url in category_info['urls'])):
+            # The sitemap says nothing changed since the pages were last fetched
+            count('pages_skipped', len(category_info['urls']))
+            record = {'category': category_key, 'status': 'unchanged',
+                      'tools': previous['tools'], 'hashes': previous['hashes']}
+            return record, [], True
+        
+        pages = [(url, fetch_page(url, category_key)) for url in category_info['urls']]
+        hashes = {url: content_hash(body) for url, body in pages if body is not None}
+        complete = len(hashes) == len(pages)
+        record = {'category': category_key}
+        futures = []
+        
+        if previous and (not complete or hashes == previous['hashes']):
+            # Unchanged (or temporarily unreachable) pages keep the previous tools as-is
+            record.update(status='unchanged' if complete else 'fetch-failed',
+                          tools=previous['tools'],
+                          hashes=hashes if complete else previous['hashes'])
+        else:
+            # Hand the bodies to the parse processes and go on fetching
+            for url, body in pages:
+                if body is not None:
+                    log(f"Parsing {category_key}: {url}", DETAIL)
+                    futures.append((url, parse_pool.submit(body, category_key, url)))
+            record.update(status='parsed', hashes=hashes if complete else None)
+        return record, futures, complete
+    
+    pending = [(key, info) for key, info in categories.items() if key not in finished]
+    results = []
+    incomplete = []
+    with ParsePool(parser, parse_workers) as parse_pool, timer('crawl'):
+        # Each category is finished and checkpointed as soon as its pages are
+        # fetched, while the fetch threads go on with the others
+        for record, futures, complete in crawl_completed(pending, scrape_category, max_workers=workers):
+            category_key = record['category']
+            if not complete:
+                incomplete.append(category_key)
+                carried = current_tools(category_key) if record['status'] == 'parsed' else None
+                if carried is not None:
+                    # Rather than publish the pages that did load, keep what the site has now
+                    for _, future in futures:
+                        future.cancel()
+                    record.update(status='fetch-failed', tools=carried)
+            if record['status'] == 'parsed':
+                with timer('parse_wait'):
+                    page_tools = [(url, parse_pool.result(future, category_key)) for url, future in futures]
+                record['tools'] = [tool for _, tools in page_tools for tool in tools]
+                if frontier is not None:
+                    for url, tools in page_tools:
+                        frontier.fetched(url, category_key, len(tools))
+                if incremental:
+                    previous = previous_block(category_key)
+                    record['changes'] = diff_tools(previous['tools'] if previous else [], record['tools'])
+            elif record['status'] == 'unchanged' and frontier is not None:
+                for url in record['hashes']:
+                    frontier.fetched(url, category_key)
+            # Only fully fetched categories are checkpointed, so a resumed run retries the rest
+            if complete:
+                journal.append(record)
+            results.append(record)
+    
+    # Assemble the database from the journal so resumed and fresh runs take the same path
+    records = journal.load()
+    for record in results:
+        records.setdefault(record['category'], record)
+    state = {}
+    changes = {}
+    
     for category_key, category_info in categories.items():
-        print(f"\n=== Scraping {category_info['name']} ===")
+        log(f"\n=== {category_info['name']} ===")
         
-        all_tools = []
+        record = records[category_key]
+        all_tools = record['tools']
+        record_category(category_key, status=record['status'], pages=len(category_info['urls']),
+                        scraped_tools=len(all_tools))
+        if record.get('hashes'):
+            state[category_key] = {'hashes': record['hashes'], 'tools': all_tools}
         
-        for url in category_info['urls']:
-            tools = scrape_category_page(url, category_key)
-            all_tools.extend(tools)
-            time.sleep(2)  # Be respectful
+        if record['status'] == 'unchanged':
+            log(f"Unchanged, kept {len(all_tools)} tools")
+        elif record['status'] == 'fetch-failed':
+            log(f"Fetch failed, kept previous {len(all_tools)} tools", QUIET)
+        elif 'changes' in record:
+            changes[category_key] = record['changes']
+            log(f"Changes: +{record['changes']['added']} "
+                f"-{record['changes']['removed']} ~{record['changes']['changed']}")
         
         if all_tools:
             database["categories"][category_key] = {
@@ -271,32 +489,117 @@ def scrape_toools_design():
                 "tools": all_tools
             }
             
-            print(f"Added {len(all_tools)} tools to {category_info['name']}")
+            log(f"Added {len(all_tools)} tools to {category_info['name']}")
             total_tools += len(all_tools)
         else:
-            print(f"No tools found for {category_info['name']}")
+            # Discovered pages without tools are simply not categories
+            log(f"No tools found for {category_info['name']}", QUIET if category_key in known else DETAIL)
     
     database["meta"]["total_tools"] = total_tools
     
-    # Save to JSON file
-    output_file = "data/design_tools_database.json"
-    os.makedirs("data", exist_ok=True)
+    unchanged = (incremental and set(state) == set(previous_state)
+                 and all(state[key]['tools'] == previous_state[key]['tools'] for key in state))
+    return database, state, changes, unchanged, incomplete
+
+def finish_scrape(state, frontier=None, incomplete=()):
+    """Record the run's state (and crawl frontier) for the next scrape and drop the journal.
+
+    With incomplete categories nothing is recorded and the journal is kept,
+    so --resume retries just those. Returns whether the scrape was finished.
+    """
+    if incomplete:
+        log(f"Not fully fetched, kept their current tools: {', '.join(incomplete)}. "
+            f"Rerun with --resume to retry them.", QUIET)
+        return False
+    save_state(state)
+    if frontier is not None:
+        frontier.save()
+    CheckpointJournal(JOURNAL_FILE).remove()
+    return True
+
+def scrape_toools_design(base_url=BASE_URL, workers=4, requests_per_second=2.0, retries=DEFAULT_RETRIES,
+                         cache=None, offline=False, incremental=False, parser=DEFAULT_PARSER, resume=False,
+                         parse_workers=None, frontier=None):
+    """Main scraping function: scrape_database() plus deduplication and writing.
+
+    In incremental mode the output files are only rewritten when the scraped
+    tools actually differ from the previous run.
+    
+    Tools listed under the same canonical URL in several categories are
+    collapsed into one record before writing (see canonical.dedupe_tools).
+    """
+    database, state, changes, unchanged, incomplete = scrape_database(
+        base_url=base_url, workers=workers, requests_per_second=requests_per_second, retries=retries,
+        cache=cache, offline=offline, incremental=incremental, parser=parser, resume=resume,
+        parse_workers=parse_workers, frontier=frontier)
+    
+    if unchanged:
+        print("\n=== Scraping Complete: no changes ===")
+        print(f"Scraped tools: {database['meta']['total_tools']}")
+        print(f"Output left untouched: {OUTPUT_FILE}")
+        if not finish_scrape(state, frontier, incomplete):
+            sys.exit(1)
+        return database
     
-    with open(output_file, 'w', encoding='utf-8') as f:
-        json.dump(database, f, indent=2, ensure_ascii=False)
+    # Collapse tools listed in several categories into one record
+    with timer('transform'):
+        database, duplicates = dedupe_tools(database)
     
-    # Also copy to public folder for Next.js
-    public_file = "public/design_tools_database.json"
-    with open(public_file, 'w', encoding='utf-8') as f:
-        json.dump(database, f, indent=2, ensure_ascii=False)
+    # Save to data/ plus the public and src/data copies used by Next.js
+    write_database(database)
+    write_index(database)
+    
+    finished = finish_scrape(state, frontier, incomplete)
     
     print(f"\n=== Scraping Complete ===")
-    print(f"Total tools: {total_tools}")
+    print(f"Total tools: {database['meta']['total_tools']} ({duplicates} duplicates collapsed)")
     print(f"Categories: {len(database['categories'])}")
-    print(f"Database saved to: {output_file}")
-    print(f"Public copy saved to: {public_file}")
+    if incremental:
+        changed = {key: counts for key, counts in changes.items() if any(counts.values())}
+        print(f"Re-parsed categories: {len(changes)}, with tool changes: {len(changed)}")
+        for category_key, counts in changed.items():
+            print(f"  {category_key}: +{counts['added']} -{counts['removed']} ~{counts['changed']}")
+    if not finished:
+        sys.exit(1)
     
     return database
 
+def save_state(state):
+    """Record page hashes and parsed tools of this run for the next incremental scrape"""
+    os.makedirs(os.path.dirname(STATE_FILE), exist_ok=True)
+    with open(STATE_FILE, 'w', encoding='utf-8') as f:
+        json.dump(state, f, ensure_ascii=False)
+
 if __name__ == "__main__":
-    scrape_toools_design()
+    parser = argparse.ArgumentParser(description="Scrape toools.design into the tools database")
+    parser.add_argument("--base-url", default=BASE_URL, help="Site root to crawl (e.g. a local mirror)")
+    parser.add_argument("--workers", type=int, default=4, help="Concurrent page fetches (1 = sequential)")
+    parser.add_argument("--rate", type=float, default=2.0, help="Max requests per second per host")
+    parser.add_argument("--retries", type=int, default=DEFAULT_RETRIES, help="Retries per page on 429/5xx and connection errors")
+    parser.add_argument("--cache-dir", default=DEFAULT_CACHE_DIR, help="Directory for cached page responses")
+    parser.add_argument("--cache-ttl", type=int, default=DEFAULT_TTL, help="Seconds a cached page is reused without revalidation")
+    parser.add_argument("--no-cache", action="store_true", help="Always download pages and skip the response cache")
+    parser.add_argument("--offline", action="store_true", help="Parse only from the response cache, never touch the network")
+    parser.add_argument("--resume", action="store_true", help="Skip categories finished by an interrupted run")
+    parser.add_argument("--parser", default=DEFAULT_PARSER, choices=["lxml", "html.parser"],
+                        help=f"BeautifulSoup backend (default: {DEFAULT_PARSER})")
+    parser.add_argument("--incremental", action="store_true", help="Only re-parse categories whose pages changed since the last run")
+    parser.add_argument("--parse-workers", type=int, default=None,
+                        help="Parse processes (default: one per core, 0 = parse in the fetch threads)")
+    parser.add_argument("--discover", action="store_true",
+                        help="Find categories from the sitemap and nav links instead of the built-in list")
+    parser.add_argument("--frontier", default=FRONTIER_FILE, help="Per-URL discovery state for --discover")
+    add_arguments(parser)
+    args = parser.parse_args()
+    
+    if args.offline and args.no_cache:
+        parser.error("--offline needs the response cache")
+    cache = None if args.no_cache else ResponseCache(args.cache_dir, ttl=args.cache_ttl)
+    frontier = Frontier(args.frontier) if args.discover else None
+    
+    instrumented(args, "scraper_updated", scrape_toools_design,
+                 base_url=args.base_url, workers=args.workers,
+                 requests_per_second=args.rate, retries=args.retries,
+                 cache=cache, offline=args.offline, incremental=args.incremental,
+                 parser=args.parser, resume=args.resume, parse_workers=args.parse_workers,
+                 frontier=frontier)
@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+"""
+Build a compact inverted search index over the tools database.
+
+Every tool's name, description and use cases are tokenized into lower-case
+terms. The index stores the sorted term list with a parallel list of posting
+lists (tool ids), so exact and prefix lookups are a binary search instead of a
+scan over every tool. Tool ids are positions in the 'tools' table, which maps
+each id back to its category key and index within that category.
+"""
+
+import argparse
+import json
+import re
+from bisect import bisect_left
+
+from db_writer import serialize_minified, write_targets
+
+DATABASE_FILE = "data/design_tools_database.json"
+INDEX_FILE = "public/search_index.json"
+INDEX_FORMAT = 1
+
+TOKEN = re.compile(r"[^\W_]+")
+
+INDEXED_FIELDS = ['name', 'description']
+
+
+def tokenize(text):
+    """Lower-case word tokens of text"""
+    return TOKEN.findall(text.lower())
+
+
+def tool_terms(tool):
+    """Distinct terms of a tool's indexed fields and use cases"""
+    terms = set()
+    for field in INDEXED_FIELDS:
+        terms.update(tokenize(tool.get(field) or ''))
+    for use_case in tool.get('use_cases') or []:
+        terms.update(tokenize(use_case))
+    return terms
+
+
+def build_index(database):
+    """Build the index document for a database"""
+    return index_categories(database['categories'].items())
+
+
+def index_categories(categories):
+    """Build the index document from a stream of (category_key, category) pairs"""
+    tools = []
+    postings = {}
+    for category_key, category in categories:
+        for position, tool in enumerate(category['tools']):
+            tool_id = len(tools)
+            tools.append([category_key, position])
+            for term in tool_terms(tool):
+                postings.setdefault(term, []).append(tool_id)
+
+    terms = sorted(postings)
+    return {
+        'format': INDEX_FORMAT,
+        'tools': tools,
+        'terms': terms,
+        'postings': [postings[term] for term in terms],
+    }
+
+
+class SearchIndex:
+    """Query side of an index document"""
+
+    def __init__(self, data):
+        self.tools = data['tools']
+        self.terms = data['terms']
+        self.postings = data['postings']
+
+    @classmethod
+    def load(cls, path=INDEX_FILE):
+        with open(path, 'r', encoding='utf-8') as f:
+            return cls(json.load(f))
+
+    def lookup(self, term, prefix=False):
+        """Tool ids for a term, or for every term starting with it when prefix=True"""
+        start = bisect_left(self.terms, term)
+        if not prefix:
+            if start < len(self.terms) and self.terms[start] == term:
+                return set(self.postings[start])
+            return set()
+
+        ids = set()
+        for i in range(start, len(self.terms)):
+            if not self.terms[i].startswith(term):
+                break
+            ids.update(self.postings[i])
+        return ids
+
+    def search(self, query):
+        """Sorted ids of tools matching every query term; the last term matches as a prefix"""
+        tokens = tokenize(query)
+        if not tokens:
+            return []
+        result = None
+        for i, token in enumerate(tokens):
+            ids = self.lookup(token, prefix=(i == len(tokens) - 1))
+            result = ids if result is None else result & ids
+            if not result:
+                return []
+        return sorted(result)
+
+    def resolve(self, database, tool_ids):
+        """The tool records for a list of ids"""
+        return [database['categories'][key]['tools'][position]
+                for key, position in (self.tools[tool_id] for tool_id in tool_ids)]
+
+
+def write_index(database, path=INDEX_FILE):
+    """Build the index for database and write it if it changed"""
+    return write_index_document(build_index(database), path)
+
+
+def write_index_document(index, path=INDEX_FILE):
+    """Write a built index if it changed"""
+    written = write_targets(serialize_minified(index), [path])
+    print(f"Search index: {len(index['terms'])} terms over {len(index['tools'])} tools "
+          f"({'updated' if written else 'unchanged'}: {path})")
+    return index
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Build the inverted search index from the tools database")
+    parser.add_argument("--database", default=DATABASE_FILE, help="Database JSON to index")
+    parser.add_argument("--output", default=INDEX_FILE, help="Where to write the index")
+    args = parser.parse_args()
+
+    with open(args.database, 'r', encoding='utf-8') as f:
+        write_index(json.load(f), args.output)
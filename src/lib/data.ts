@@ -1,10 +1,33 @@
-import type { DesignToolsData } from '@/types';
+import type { Category, DesignToolsData } from '@/types';
 import designToolsDatabase from '@/data/design_tools_database.json';
 
+// Tools listed in several categories are stored once, in their first category,
+// with a `categories` list; put them back into every category they belong to.
+function expandCategoryMemberships(data: DesignToolsData): DesignToolsData {
+  const categories: Record<string, Category> = {};
+  for (const [key, category] of Object.entries(data.categories)) {
+    categories[key] = { ...category, tools: [...category.tools] };
+  }
+
+  for (const [key, category] of Object.entries(data.categories)) {
+    for (const tool of category.tools) {
+      for (const member of tool.categories ?? []) {
+        if (member !== key && categories[member]) {
+          categories[member].tools.push(tool);
+        }
+      }
+    }
+  }
+
+  return { ...data, categories };
+}
+
+const designToolsData = expandCategoryMemberships(designToolsDatabase as DesignToolsData);
+
 export async function getDesignToolsData(): Promise<DesignToolsData | null> {
   try {
     // Direct import of JSON data - works perfectly with SSR and is great for SEO
-    return designToolsDatabase as DesignToolsData;
+    return designToolsData;
   } catch (error) {
     console.error('Error loading design tools data:', error);
     return null;
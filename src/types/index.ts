@@ -5,6 +5,8 @@ export interface Tool {
   image: string;
   pricing: string;
   use_cases?: string[];
+  // Every category the tool is listed in, when it appears in more than one
+  categories?: string[];
 }
 
 export interface Category {
@@ -19,6 +21,7 @@ export interface DesignToolsData {
     created_date: string;
     total_tools: number;
     description: string;
+    build?: number;
   };
   categories: Record<string, Category>;
 }